@@ -35,11 +35,11 @@ import argparse
 import logging
 import abc
 import pickle
-from itertools import islice
+from itertools import count, islice
 import multiprocessing as mp
 
 import pkg_resources
-from six import add_metaclass, iteritems, itervalues, text_type, PY3
+from six import add_metaclass, iteritems, text_type, PY3
 
 from . import __version__ as package_version
 from .datasource import native, sbml
@@ -130,7 +130,15 @@ class MetabolicMixin(object):
     def __init__(self, *args, **kwargs):
         super(MetabolicMixin, self).__init__(*args, **kwargs)
 
-        self._mm = self._model.create_metabolic_model()
+        self.__mm = None
+
+    @property
+    def _mm(self):
+        # Created lazily so commands that exit before touching the metabolic
+        # model do not pay for building it.
+        if self.__mm is None:
+            self.__mm = self._model.create_metabolic_model()
+        return self.__mm
 
     def report_flux_balance_error(self, exc=None):
         to_check = set()
@@ -270,15 +278,19 @@ class ParallelTaskMixin(object):
             type=int, default=0)
         super(ParallelTaskMixin, cls).init_parser(parser)
 
+    def _get_worker_count(self, cpus_per_worker=1):
+        """Return the number of workers that an executor would use."""
+        if self._args.parallel > 0:
+            return self._args.parallel
+
+        try:
+            return mp.cpu_count() // cpus_per_worker
+        except NotImplementedError:
+            return 1
+
     def _create_executor(self, handler, args, cpus_per_worker=1):
         """Return a new :class:`.Executor` instance."""
-        if self._args.parallel > 0:
-            workers = self._args.parallel
-        else:
-            try:
-                workers = mp.cpu_count() // cpus_per_worker
-            except NotImplementedError:
-                workers = 1
+        workers = self._get_worker_count(cpus_per_worker)
 
         if workers != 1:
             logger.info('Using {} parallel worker processes...'.format(
@@ -343,21 +355,19 @@ class ExecutorError(Exception):
 
 
 class _ExecutorProcess(mp.Process):
-    def __init__(self, task_queue, result_queue, handler_init,
-                 handler_args=()):
+    def __init__(self, task_queue, result_queue, handler_pickle):
         super(_ExecutorProcess, self).__init__()
         self._task_queue = task_queue
         self._result_queue = result_queue
-        self._handler_init = handler_init
-        self._handler_args = handler_args
+        self._handler_pickle = handler_pickle
 
     def run(self):
         try:
-            handler = self._handler_init(*self._handler_args)
-            for tasks in iter(self._task_queue.get, None):
-                results = [
-                    (task, handler.handle_task(*task)) for task in tasks]
-                self._result_queue.put(results)
+            handler_init, handler_args = pickle.loads(self._handler_pickle)
+            handler = handler_init(*handler_args)
+            for seq, tasks in iter(self._task_queue.get, None):
+                results = [handler.handle_task(*task) for task in tasks]
+                self._result_queue.put((seq, results))
         except BaseException as e:
             try:
                 pickled_exc = pickle.dumps(e, -1)
@@ -373,11 +383,15 @@ class Executor(object):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+        self.join()
         return False
 
     def close(self):
         pass
 
+    def join(self):
+        pass
+
 
 class ProcessPoolExecutor(Executor):
     def __init__(self, handler_init, handler_args=(), processes=None):
@@ -389,53 +403,67 @@ class ProcessPoolExecutor(Executor):
 
         self._process_count = processes
         self._processes = []
+        self._closed = False
         self._task_queue = mp.Queue()
         self._result_queue = mp.Queue()
 
+        # Serialize the handler setup once in the parent so each worker
+        # process only has to ship (or inherit) the same opaque buffer
+        # instead of re-pickling the full argument tuple (which may include
+        # a large model) per process.
+        handler_pickle = pickle.dumps(
+            (handler_init, handler_args), pickle.HIGHEST_PROTOCOL)
+
         for _ in range(self._process_count):
             p = _ExecutorProcess(
-                self._task_queue, self._result_queue, handler_init,
-                handler_args)
+                self._task_queue, self._result_queue, handler_pickle)
             p.start()
             self._processes.append(p)
 
     def apply(self, task):
-        self._task_queue.put([task])
-        results = self._result_queue.get()
-        if isinstance(results, _ErrorMarker):
-            exception = pickle.loads(results.pickled_exception)
+        self._task_queue.put((0, [task]))
+        message = self._result_queue.get()
+        if isinstance(message, _ErrorMarker):
+            exception = pickle.loads(message.pickled_exception)
             raise exception
 
-        return next(itervalues(results))
+        _, results = message
+        return results[0]
 
     def imap_unordered(self, iterable, chunksize=1):
-        def iter_chunks():
-            while True:
-                chunk = list(islice(iterable, chunksize))
-                if len(chunk) == 0:
-                    break
-                yield chunk
-
-        it = iter_chunks()
+        # Task chunks are identified by a sequence number and kept in the
+        # parent until the results arrive, so workers only send the results
+        # back instead of echoing each task through the result queue.
+        pending = {}
+        sequence = count()
+
+        def put_chunk():
+            chunk = list(islice(iterable, chunksize))
+            if len(chunk) == 0:
+                return False
+
+            seq = next(sequence)
+            pending[seq] = chunk
+            self._task_queue.put((seq, chunk))
+            return True
+
         workers = 0
         for i in range(self._process_count):
-            tasks = next(it, None)
-            if tasks is None:
+            if not put_chunk():
                 break
 
-            self._task_queue.put(tasks)
             workers += 1
 
         exception = None
         while workers > 0:
-            results = self._result_queue.get()
-            if isinstance(results, _ErrorMarker):
+            message = self._result_queue.get()
+            if isinstance(message, _ErrorMarker):
                 if exception is None:
-                    if results.pickled_exception is None:
+                    if message.pickled_exception is None:
                         exception = ExecutorError(
                             "Unpicklable exception raised by child")
                     else:
-                        exception = pickle.loads(results.pickled_exception)
+                        exception = pickle.loads(message.pickled_exception)
                 workers -= 1
                 self._process_count -= 1
                 continue
@@ -443,19 +471,20 @@ class ProcessPoolExecutor(Executor):
             if exception is not None:
                 continue
 
-            tasks = next(it, None)
-            if tasks is None:
+            if not put_chunk():
                 workers -= 1
 
-            self._task_queue.put(tasks)
-
-            for task, result in results:
+            seq, results = message
+            for task, result in zip(pending.pop(seq), results):
                 yield task, result
 
         if exception is not None:
             raise exception
 
     def close(self):
+        if self._closed:
+            return
+        self._closed = True
         for i in range(self._process_count):
             self._task_queue.put(None)
 
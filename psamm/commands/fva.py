@@ -18,17 +18,24 @@
 
 from __future__ import unicode_literals
 
+import sys
 import time
 import logging
-from itertools import product
+import threading
+from itertools import chain, product
 
 from ..command import (Command, SolverCommandMixin, MetabolicMixin,
                        ObjectiveMixin, LoopRemovalMixin, ParallelTaskMixin)
+from six.moves import queue
+
+from ..lpsolver import lp
 from ..util import MaybeRelative
 from .. import fluxanalysis
 
 logger = logging.getLogger(__name__)
 
+_INF = float('inf')
+
 
 class FluxVariabilityCommand(MetabolicMixin, SolverCommandMixin,
                              LoopRemovalMixin, ObjectiveMixin,
@@ -46,16 +53,23 @@ class FluxVariabilityCommand(MetabolicMixin, SolverCommandMixin,
                             'biomass.)',
                             type=MaybeRelative,
                             default=MaybeRelative('100%'))
+        parser.add_argument('--chunksize',
+                            help='Number of tasks dispatched to a worker'
+                            ' at a time (0=auto)',
+                            type=int, default=0)
         super(FluxVariabilityCommand, cls).init_parser(parser)
 
     def run(self):
         """Run flux variability command"""
 
-        # Load compound information
+        # Load compound information into a flat name mapping to avoid the
+        # entry and properties lookups per compound in the output loop.
+        name_map = {
+            entry.id: entry.properties.get('name', entry.id)
+            for entry in self._model.compounds}
+
         def compound_name(id):
-            if id not in self._model.compounds:
-                return id
-            return self._model.compounds[id].properties.get('name', id)
+            return name_map.get(id, id)
 
         reaction = self._get_objective()
         if not self._mm.has_reaction(reaction):
@@ -84,47 +98,182 @@ class FluxVariabilityCommand(MetabolicMixin, SolverCommandMixin,
         logger.info('Setting objective threshold to {}'.format(
             threshold))
 
+        # Verify in the main process that the threshold constraint is
+        # feasible at all, so the workers do not each waste an LP solve
+        # discovering an infeasible threshold.
+        check_problem = fluxanalysis.FluxBalanceProblem(self._mm, solver)
+        if enable_tfba:
+            check_problem.add_thermodynamic()
+        check_problem.prob.add_linear_constraints(
+            check_problem.get_flux_var(reaction) >= float(threshold))
+        try:
+            check_problem.check_constraints()
+        except fluxanalysis.FluxBalanceError as e:
+            self.fail(
+                'No solution is possible with the objective threshold'
+                ' {}'.format(threshold), e)
+
+        # Snapshot the reaction set once; the property iterates the
+        # underlying model on every access.
+        reactions = tuple(self._mm.reactions)
+
+        # Reactions with equal lower and upper bounds are fixed, so the flux
+        # bounds are known without solving any LPs for them.
+        trivial = []
+        nontrivial = []
+        for reaction_id in reactions:
+            lower, upper = self._mm.limits[reaction_id]
+            if lower == upper:
+                trivial.append((reaction_id, (lower, upper)))
+            else:
+                nontrivial.append(reaction_id)
+
+        # Dispatch the most connected reactions first. Their LPs tend to
+        # take the longest, so starting them early balances the load across
+        # workers towards the end of the run.
+        nontrivial.sort(key=lambda reaction_id: -sum(
+            1 for _ in self._mm.get_reaction_values(reaction_id)))
+
         handler_args = (
             self._mm, solver, enable_tfba, float(threshold), reaction)
+        # The FVA tasks are independent LPs, so parallelism across reactions
+        # with one CPU per worker scales better than fewer workers running a
+        # multi-threaded solver per LP.
         executor = self._create_executor(
-            FVATaskHandler, handler_args, cpus_per_worker=2)
+            FVATaskHandler, handler_args, cpus_per_worker=1)
+
+        # Larger chunks amortize the per-message IPC cost when the
+        # individual LP solves are fast.
+        chunksize = self._args.chunksize
+        if chunksize <= 0:
+            workers = self._get_worker_count(cpus_per_worker=1)
+            chunksize = max(
+                16, (2 * len(nontrivial)) // (8 * max(1, workers)))
 
         def iter_results():
-            results = {}
+            for reaction_id, bounds in trivial:
+                yield reaction_id, bounds
+
+            # Collect partial results in index-mapped arrays instead of a
+            # dict keyed by reaction. A result is complete when both the
+            # lower and upper bound entries have been filled in.
+            index = {r: i for i, r in enumerate(nontrivial)}
+            lower_bounds = [None] * len(nontrivial)
+            upper_bounds = [None] * len(nontrivial)
+
+            # Each task is a batch of reactions solved in one worker call so
+            # results come back as one message per batch instead of one per
+            # LP solve.
+            batches = tuple(
+                tuple(nontrivial[i:i + chunksize])
+                for i in range(0, len(nontrivial), chunksize))
+
             with executor:
-                for (reaction_id, direction), value in executor.imap_unordered(
-                        product(self._mm.reactions, (1, -1)), 16):
-                    if reaction_id not in results:
-                        results[reaction_id] = value
-                        continue
+                # Schedule all minimizations before all maximizations since
+                # consecutive optimizations in the same direction allow the
+                # solver to reuse more of the basis structure.
+                tasks = chain(
+                    product(batches, (-1,)),
+                    product(batches, (1,)))
+                for (batch, direction), values in executor.imap_unordered(
+                        tasks, 1):
+                    for reaction_id, value in zip(batch, values):
+                        i = index[reaction_id]
+                        if direction == -1:
+                            lower_bounds[i] = value
+                            other_value = upper_bounds[i]
+                        else:
+                            upper_bounds[i] = value
+                            other_value = lower_bounds[i]
 
-                    other_value = results[reaction_id]
-                    if direction == -1:
-                        bounds = value, other_value
-                    else:
-                        bounds = other_value, value
+                        if other_value is not None:
+                            yield reaction_id, (
+                                lower_bounds[i], upper_bounds[i])
 
-                    yield reaction_id, bounds
+        # Format and write results on a separate thread so a slow stdout
+        # consumer does not throttle the collection of LP results. Lines are
+        # buffered and written in batches instead of paying the write and
+        # flush cost of print for every reaction.
+        output_queue = queue.Queue()
 
-            executor.join()
+        def write_results():
+            lines = []
+            line_format = '{}\t{}\t{}\t{}\n'.format
+            get_reaction = self._mm.get_reaction
+            for reaction_id, lower, upper in iter(output_queue.get, None):
+                rxt = get_reaction(reaction_id).translated_compounds(
+                    compound_name)
+                lines.append(line_format(reaction_id, lower, upper, rxt))
+                if len(lines) >= 512:
+                    sys.stdout.write(''.join(lines))
+                    del lines[:]
 
-        for reaction_id, (lower, upper) in iter_results():
-            rx = self._mm.get_reaction(reaction_id)
-            rxt = rx.translated_compounds(compound_name)
-            print('{}\t{}\t{}\t{}'.format(reaction_id, lower, upper, rxt))
+            sys.stdout.write(''.join(lines))
+            sys.stdout.flush()
+
+        writer = threading.Thread(target=write_results)
+        writer.start()
+        try:
+            for reaction_id, (lower, upper) in iter_results():
+                output_queue.put((reaction_id, lower, upper))
+        finally:
+            output_queue.put(None)
+            writer.join()
 
         logger.info('Solving took {:.2f} seconds'.format(
             time.time() - start_time))
 
 
 class FVATaskHandler(object):
+    """Task handler that solves the flux bound LPs of the worker.
+
+    The LP problem is built once when the handler is created and is reused
+    for every task. Between tasks only the objective coefficient is swapped
+    so the solver can warm-start each optimization from the basis of the
+    previous solution instead of re-solving from scratch.
+    """
+
     def __init__(self, model, solver, enable_tfba, threshold, reaction):
         self._problem = fluxanalysis.FluxBalanceProblem(model, solver)
         if enable_tfba:
             self._problem.add_thermodynamic()
 
+        # The threshold is applied as an inequality (not an equality) so
+        # that the basis stays dual-feasible across objective swaps; this is
+        # what makes the warm-starts effective over all 2n solves.
         self._problem.prob.add_linear_constraints(
             self._problem.get_flux_var(reaction) >= threshold)
 
-    def handle_task(self, reaction_id, direction):
-        return self._problem.flux_bound(reaction_id, direction)
+        self._objective = None
+
+        # Objective expressions are cached so repeated tasks on the same
+        # reaction do not rebuild the expression objects.
+        self._flux_vars = {}
+        self._objective_exprs = {}
+
+    def handle_task(self, reaction_ids, direction):
+        return [self._flux_bound(reaction_id, direction)
+                for reaction_id in reaction_ids]
+
+    def _flux_bound(self, reaction_id, direction):
+        flux_var = self._flux_vars.get(reaction_id)
+        if flux_var is None:
+            flux_var = self._flux_vars[reaction_id] = (
+                self._problem.get_flux_var(reaction_id))
+
+        if self._objective != (reaction_id, direction):
+            objective = self._objective_exprs.get((reaction_id, direction))
+            if objective is None:
+                objective = self._objective_exprs[reaction_id, direction] = (
+                    direction * flux_var)
+            self._problem.prob.set_objective(objective)
+            self._objective = reaction_id, direction
+
+        try:
+            self._problem.prob.solve(lp.ObjectiveSense.Maximize)
+        except lp.SolverError:
+            if self._problem.prob.result.unbounded:
+                return direction * _INF
+            raise
+
+        return self._problem.prob.result.get_value(flux_var)
@@ -221,7 +221,7 @@ def solve_gimme_problem(problem, mm, biomass, reversible_gene_assoc,
             reaction = reaction.replace('_reverse', '')
             original_reaction_set.add(reaction)
     below_threshold_ids = set()
-    for reaction in ci_dict.keys():
+    for reaction in ci_dict:
         reaction = reaction.replace('_forward', '')
         reaction = reaction.replace('_reverse', '')
         below_threshold_ids.add(reaction)
@@ -688,13 +688,13 @@ def add_conc_constraints(xij, problem, cpd_conc_dict,
         cpdid_xij_dict[cp] = xij(cp)
         var = xij(cp)
         # Define default constraints for anything not set in the conc file
-        if cp not in cpd_conc_dict.keys():
+        if cp not in cpd_conc_dict:
             if cp not in excluded_cpd_list:
                 # Add concentration constraints as the
                 # ln of the concentration (M).
                 problem.add_linear_constraints(var >= math.log(0.00001))
                 problem.add_linear_constraints(var <= math.log(0.02))
-        elif cp in cpd_conc_dict.keys():
+        elif cp in cpd_conc_dict:
             if cp not in excluded_cpd_list:
                 conc_limits = cpd_conc_dict[cp]
                 if conc_limits[0] > conc_limits[1]:
@@ -762,7 +762,7 @@ def calculate_dgr(mm, dgf_dict, excluded_reactions,
             rxn = mm.get_reaction(reaction)
             if any(dgf_dict.get(j[0]) is None for j in rxn.compounds):
                 for j in rxn.compounds:
-                    if j[0] not in dgf_dict.keys():
+                    if j[0] not in dgf_dict:
                         print(j[0])
                 if reaction not in ph_difference_rxn:
                     logger.error(u'Reaction {} contains at least 1 compound '
@@ -776,7 +776,7 @@ def calculate_dgr(mm, dgf_dict, excluded_reactions,
                 # deltaGf for reaction j.
                 for cpd in rxn.compounds:
                     cpd_0 = convert_to_unicode(str(cpd[0]))
-                    if cpd_0 in dgf_scaling.keys():
+                    if cpd_0 in dgf_scaling:
                         dgscale = dgf_scaling[cpd_0]
                     else:
                         dgscale = 1
@@ -914,7 +914,7 @@ def add_reaction_constraints(
             vi = _v(reaction)
             vmax = mm.limits[reaction].upper
             if reaction in testing_list:
-                if reaction in transport_parameters.keys():
+                if reaction in transport_parameters:
                     (c, h) = transport_parameters[reaction]
                     ddph = Decimal(-2.3)*Decimal(h)*idg*tkelvin*delta_ph
                     dpsi = Decimal(33.33) * delta_ph - Decimal(143.33)
@@ -954,7 +954,7 @@ def add_reaction_constraints(
                             dgri - k + (k * zi) <= -epsilon)
                         problem.add_linear_constraints(vi <= zi * vmax)
 
-        if reaction in lump_rxn_list.keys():
+        if reaction in lump_rxn_list:
             problem.define(u'yi_{}'.format(reaction), lower=int(0),
                            upper=int(1), types=lp.VariableType.Binary)
             if reaction not in new_excluded_reactions:
@@ -25,7 +25,8 @@ import io
 import os
 import csv
 import argparse
-from collections import defaultdict, Counter
+from collections import defaultdict
+from itertools import chain
 from six import text_type
 from ..command import MetabolicMixin, Command, FilePrefixAppendAction, \
     convert_to_unicode
@@ -47,6 +48,22 @@ ALT_COLOR = '#b3fcb8'
 
 EPSILON = 1e-5
 
+# The graph writers emit many small writes; a large output buffer keeps
+# them from translating into as many small system calls.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Cache of Atom objects keyed by element symbol, so the membership tests
+# in the per-compound loops reuse one Atom instead of constructing and
+# hashing a new one for every call.
+_ELEMENT_ATOMS = {}
+
+
+def _element_atom(element):
+    atom = _ELEMENT_ATOMS.get(element)
+    if atom is None:
+        atom = _ELEMENT_ATOMS[element] = Atom(element)
+    return atom
+
 
 class VisualizationCommand(MetabolicMixin,
                            Command, FilePrefixAppendAction):
@@ -135,39 +152,48 @@ class VisualizationCommand(MetabolicMixin,
             self._mm, self._args.subset, self._args.exclude)
 
         if self._args.array is not None and int(self._args.array) <= 0:
-            logger.error(
+            self.fail(
                 "'--array' should be followed by a positive integer, number "
                 "'{}' is invalid. Visualization has stopped, please fix the "
                 "number first".format(self._args.array))
-            quit()
 
         if self._args.element.lower() == 'all':
             self._args.element = None
         else:
             if self._args.element not in _AtomType._ELEMENTS:
-                logger.error(
+                self.fail(
                     "Given element '{}' doesn't represent any chemical element"
                     ", visualization has terminated. Please check your "
                     "--element parameter".format(self._args.element))
-                quit()
+
+        # Frequently passed arguments are bound once instead of being
+        # resolved through the argparse namespace at every use.
+        method = self._args.method
+        combine = self._args.combine
 
         self.analysis = None
         reaction_dict = {}
+        # The flux files are plain two- and three-column TSV produced by
+        # the fba and fva commands; splitting the lines directly avoids
+        # the csv reader state machine.
         if self._args.fba is not None:
             self.analysis = 'fba'
-            for row in csv.reader(self._args.fba, delimiter=str('\t')):
-                row[0] = convert_to_unicode(row[0])
+            for line in self._args.fba:
+                if not line.strip():
+                    continue
+                row = convert_to_unicode(line).rstrip('\r\n').split('\t')
                 if row[0] in vis_rxns:
                     try:
-                        if abs(float(row[1])) <= EPSILON:
-                            row[1] = 0
+                        flux = float(row[1])
+                        if abs(flux) <= EPSILON:
+                            flux = 0.0
                     except ValueError:
                         logger.warning(
                             'Reaction {} has an invalid flux value of {} '
                             'and will be considered as a flux of 0'.format(
                                 row[0], row[1]))
-                        row[1] = 0
-                    reaction_dict[row[0]] = (float(row[1]), 1)
+                        flux = 0.0
+                    reaction_dict[row[0]] = (flux, 1)
                 else:
                     logger.warning(
                         'Reaction {} in input fba file was excluded from '
@@ -175,21 +201,25 @@ class VisualizationCommand(MetabolicMixin,
 
         if self._args.fva is not None:
             self.analysis = 'fva'
-            for row in csv.reader(self._args.fva, delimiter=str('\t')):
-                row[0] = convert_to_unicode(row[0])
+            for line in self._args.fva:
+                if not line.strip():
+                    continue
+                row = convert_to_unicode(line).rstrip('\r\n').split('\t')
                 if row[0] in vis_rxns:
                     try:
-                        if abs(float(row[1])) <= EPSILON:
-                            row[1] = 0
-                        if abs(float(row[2])) <= EPSILON:
-                            row[2] = 0
+                        lower = float(row[1])
+                        upper = float(row[2])
+                        if abs(lower) <= EPSILON:
+                            lower = 0.0
+                        if abs(upper) <= EPSILON:
+                            upper = 0.0
                     except ValueError:
                         logger.warning(
                             'Reaction {} has an invalid flux value of {},{} '
                             'and will be considered as a flux of 0,0'.format(
                                 row[0], row[1], row[2]))
-                        row[1], row[2] = 0, 0
-                    reaction_dict[row[0]] = (float(row[1]), float(row[2]))
+                        lower, upper = 0.0, 0.0
+                    reaction_dict[row[0]] = (lower, upper)
                 else:
                     logger.warning(
                         'Reaction {} in input fva file was excluded from '
@@ -197,40 +227,60 @@ class VisualizationCommand(MetabolicMixin,
                         'model'.format(row[0]))
 
         exclude_for_fpp = [self._model.biomass_reaction] + self._args.exclude
-        filter_dict, style_flux_dict = graph.make_network_dict(
-            self._model, self._mm, vis_rxns, self._args.method,
-            self._args.element, exclude_for_fpp, reaction_dict, self.analysis)
-
-        model_compound_entries, model_reaction_entries = {}, {}
-        for c in self._model.compounds:
-            model_compound_entries[c.id] = c
-        for r in self._model.reactions:
-            model_reaction_entries[r.id] = r
-
-        hide_edges = []
+        try:
+            filter_dict, style_flux_dict = graph.make_network_dict(
+                self._model, self._mm, vis_rxns, method,
+                self._args.element, exclude_for_fpp, reaction_dict,
+                self.analysis, compound_formula)
+        except ValueError as e:
+            self.fail(str(e), e)
+
+        model_compound_entries = {c.id: c for c in self._model.compounds}
+        model_reaction_entries = {r.id: r for r in self._model.reactions}
+
+        hide_edges = set()
         if self._args.hide_edges is not None:
             for row in csv.reader(self._args.hide_edges, delimiter=str('\t')):
-                hide_edges.append((row[0], row[1]))
-                hide_edges.append((row[1], row[0]))
+                hide_edges.add((row[0], row[1]))
+                hide_edges.add((row[1], row[0]))
 
         cpair_dict, new_id_mapping, new_style_flux_dict = \
             graph.make_cpair_dict(
-                filter_dict, self._args.method, self._args.combine,
+                filter_dict, method, combine,
                 style_flux_dict, hide_edges)
 
         g = graph.make_bipartite_graph_object(
-            cpair_dict, new_id_mapping, self._args.method, self._args.combine,
+            cpair_dict, new_id_mapping, method, combine,
             model_compound_entries, new_style_flux_dict, self.analysis)
 
+        # Bind loop invariants once; attribute lookups on the argparse
+        # namespace and the model are otherwise repeated per reaction.
+        element = self._args.element
+        biomass_reaction = self._model.biomass_reaction
+        mm = self._mm
+
+        # Resolve which compounds contain the target element once, so the
+        # exchange loop tests set membership instead of probing the Formula
+        # object for every compound occurrence.
+        cpds_with_element = None
+        if element is not None:
+            target_atom = _element_atom(element)
+            cpds_with_element = set(
+                name for name, formula in compound_formula.items()
+                if target_atom in formula)
+
         exchange_cpds = set()
+        node_ids = g.nodes_id_dict
         for rid in vis_rxns:
-            if self._mm.is_exchange(rid) and rid != \
-                    self._model.biomass_reaction:
-                exchange_rxn = self._mm.get_reaction(rid)
+            if mm.is_exchange(rid) and rid != biomass_reaction:
+                exchange_rxn = mm.get_reaction(rid)
                 for c, _ in exchange_rxn.compounds:
-                    if c not in g.nodes_id_dict:
+                    # Node ids are strings; testing the Compound object
+                    # itself never matched and re-added existing nodes.
+                    if text_type(c) not in node_ids:
                         g = add_ex_cpd(g, c, model_compound_entries[c.name],
-                                       compound_formula, self._args.element)
+                                       compound_formula, element,
+                                       cpds_with_element)
                     exchange_cpds.add(c)
                 g = add_exchange_rxns(
                     g, rid, exchange_rxn, style_flux_dict)
@@ -245,10 +295,9 @@ class VisualizationCommand(MetabolicMixin,
         bio_cpds_sub = set()
         bio_cpds_pro = set()
 
-        if self._model.biomass_reaction in vis_rxns:
-            if self._model.biomass_reaction in model_reaction_entries:
-                nm_biomass_rxn = \
-                    model_reaction_entries[self._model.biomass_reaction]
+        if biomass_reaction in vis_rxns:
+            if biomass_reaction in model_reaction_entries:
+                nm_biomass_rxn = model_reaction_entries[biomass_reaction]
                 g = add_biomass_rxns(g, nm_biomass_rxn)
                 for cpd, _ in nm_biomass_rxn.equation.left:
                     bio_cpds_sub.add(text_type(cpd))
@@ -257,8 +306,7 @@ class VisualizationCommand(MetabolicMixin,
             else:
                 logger.warning(
                     'Biomass reaction {} was excluded from visualization '
-                    'due to missing reaction entry'.format(
-                        self._model.biomass_reaction))
+                    'due to missing reaction entry'.format(biomass_reaction))
 
         for node in g.nodes:
             if node.props['id'] in bio_cpds_sub:
@@ -270,7 +318,7 @@ class VisualizationCommand(MetabolicMixin,
             else:
                 continue
 
-        if self._args.method == 'no-fpp' and self._args.combine != 0:
+        if method == 'no-fpp' and combine != 0:
             logger.warning(
                 '--combine option is not compatible with no-fpp method')
 
@@ -288,18 +336,22 @@ class VisualizationCommand(MetabolicMixin,
             boundary_tree, extracellular = make_cpt_tree(boundaries,
                                                          extracellular)
             with io.open('{}.dot'.format(output), 'w', encoding='utf-8',
-                         errors='backslashreplace') as f:
+                         errors='backslashreplace',
+                         buffering=_WRITE_BUFFER_SIZE) as f:
                 g.write_graphviz_compartmentalized(
                     f, boundary_tree, extracellular, width, height)
         else:
             with io.open('{}.dot'.format(output), 'w', encoding='utf-8',
-                         errors='backslashreplace') as f:
+                         errors='backslashreplace',
+                         buffering=_WRITE_BUFFER_SIZE) as f:
                 g.write_graphviz(f, width, height)
         with io.open('{}.nodes.tsv'.format(output), 'w', encoding='utf-8',
-                     errors='backslashreplace') as f:
+                     errors='backslashreplace',
+                     buffering=_WRITE_BUFFER_SIZE) as f:
             g.write_nodes_tables(f)
         with io.open('{}.edges.tsv'.format(output), 'w', encoding='utf-8',
-                     errors='backslashreplace') as f:
+                     errors='backslashreplace',
+                     buffering=_WRITE_BUFFER_SIZE) as f:
             g.write_edges_tables(f)
 
         if self._args.image is not None:
@@ -313,7 +365,7 @@ class VisualizationCommand(MetabolicMixin,
                     logger.info(
                         'This graph contains {} reactions, '
                         'graphs of this size may take a long time to '
-                        'create'.format(len(filter_dict.keys())))
+                        'create'.format(len(filter_dict)))
                 if self._args.array is None:
                     render('dot', self._args.image, '{}.dot'.format(output))
                 else:
@@ -344,22 +396,25 @@ def rxnset_for_vis(mm, subset_file, exclude):
                      or compound ids.
         exclude: rxns to exclude
     """
-    all_cpds = set()
-    for cpd in mm.compounds:
-        all_cpds.add(text_type(cpd))
     if subset_file is None:
         if len(exclude) == 0:
             final_rxn_set = set(mm.reactions)
         else:
+            # The exclude argument is a list; a set avoids scanning it
+            # once per reaction in the model.
+            exclude_set = frozenset(exclude)
             final_rxn_set = set(
-                [rxn for rxn in mm.reactions if rxn not in exclude])
+                rxn for rxn in mm.reactions if rxn not in exclude_set)
     else:
+        # Only needed to classify the subset entries, so build it in the
+        # branch that reads the file.
+        all_cpds = set(text_type(cpd) for cpd in mm.compounds)
         final_rxn_set = set()
         cpd_set = set()
         rxn_set = set()
-        for line in subset_file.readlines():
-            if not convert_to_unicode(line).startswith('#'):
-                value = convert_to_unicode(line).strip()
+        for line in subset_file:
+            value = convert_to_unicode(line).strip()
+            if not value.startswith('#'):
                 if value in all_cpds:
                     cpd_set.add(value)
                 elif mm.has_reaction(value):
@@ -398,18 +453,19 @@ def add_biomass_rxns(g, nm_bio_reaction):
     bio_reaction = nm_bio_reaction.equation
     biomass_rxn_id = nm_bio_reaction.id
     direction = graph.dir_value(bio_reaction.direction)
-    reactant_list, product_list = [], []
-    for c, _ in bio_reaction.left:
-        reactant_list.append(c)
-    for c, _ in bio_reaction.right:
-        product_list.append(c)
-    bio_pair = Counter()
+    # Sets instead of lists; each compound of the reaction is tested for
+    # membership against both sides below.
+    reactant_list = set(c for c, _ in bio_reaction.left)
+    product_list = set(c for c, _ in bio_reaction.right)
+    # A plain integer suffix; the Counter it replaces was only ever
+    # keyed by the single biomass reaction id.
+    bio_count = 0
+    edges = []
     for c, _ in bio_reaction.compounds:
         if text_type(c) in g.nodes_id_dict:
-            bio_pair[biomass_rxn_id] += 1
+            bio_count += 1
             node_bio = graph.Node({
-                'id': u'{}_{}'.format(biomass_rxn_id,
-                                      bio_pair[biomass_rxn_id]),
+                'id': u'{}_{}'.format(biomass_rxn_id, bio_count),
                 'entry': [nm_bio_reaction],
                 'shape': 'box',
                 'style': 'filled',
@@ -420,15 +476,17 @@ def add_biomass_rxns(g, nm_bio_reaction):
             g.add_node(node_bio)
 
             if c in reactant_list:
-                g.add_edge(graph.Edge(g.get_node(text_type(c)), node_bio,
-                                      {'dir': direction}))
+                edges.append(graph.Edge(g.get_node(text_type(c)), node_bio,
+                                        {'dir': direction}))
             if c in product_list:
-                g.add_edge(graph.Edge(node_bio, g.get_node(text_type(c)),
-                                      {'dir': direction}))
+                edges.append(graph.Edge(node_bio, g.get_node(text_type(c)),
+                                        {'dir': direction}))
+    g.add_edges(edges)
     return g
 
 
-def add_ex_cpd(g, mm_cpd, nm_cpd, compound_formula, element):
+def add_ex_cpd(g, mm_cpd, nm_cpd, compound_formula, element,
+               cpds_with_element=None):
     node_dict = {'id': text_type(mm_cpd),
                  'entry': [nm_cpd],
                  'compartment': mm_cpd.compartment,
@@ -441,7 +499,12 @@ def add_ex_cpd(g, mm_cpd, nm_cpd, compound_formula, element):
                          '--element all to visualize all pathways without '
                          'compound formula input.'.format(mm_cpd.name))
         else:
-            if Atom(element) in compound_formula[mm_cpd.name]:
+            if cpds_with_element is not None:
+                has_element = mm_cpd.name in cpds_with_element
+            else:
+                has_element = (
+                    _element_atom(element) in compound_formula[mm_cpd.name])
+            if has_element:
                 node = graph.Node(node_dict)
                 g.add_node(node)
     else:
@@ -460,24 +523,28 @@ def add_node_props(g, recolor_dict):
         recolor_dict: dict of rxn_id/cpd_id[compartment] : hex color code.
     return: a graph object that contains a set of node with defined color.
     """
-    cpd_types = ['cpd', 'cpd_biomass_substrate',
-                 'cpd_biomass_product', 'cpd_exchange']
+    cpd_types = frozenset(['cpd', 'cpd_biomass_substrate',
+                           'cpd_biomass_product', 'cpd_exchange'])
+    # The attribute sets are identical for every node of a kind; update
+    # from one shared constant dict per kind instead of assigning the
+    # same keys node by node.
+    cpd_props = {'style': 'filled', 'fillcolor': COMPOUND_COLOR,
+                 'shape': 'ellipse'}
+    rxn_props = {'style': 'filled', 'fillcolor': REACTION_COLOR,
+                 'shape': 'box'}
     for node in g.nodes:
-        node.props['style'] = 'filled'
         if node.props['type'] in cpd_types:
-            node.props['fillcolor'] = COMPOUND_COLOR
-            node.props['shape'] = 'ellipse'
+            node.props.update(cpd_props)
         elif node.props['type'] == 'rxn':
-            node.props['fillcolor'] = REACTION_COLOR
-            node.props['shape'] = 'box'
+            node.props.update(rxn_props)
         else:
-            if node.props['type'] not in ['bio_rxn', 'Ex_rxn']:
+            node.props['style'] = 'filled'
+            if node.props['type'] not in ('bio_rxn', 'Ex_rxn'):
                 logger.error('invalid nodes:', type(
                     node.props['entry']), node.props['entry'])
-    for r_id in recolor_dict:
-        if r_id in g.nodes_original_id_dict:
-            for node in g.nodes_original_id_dict[r_id]:
-                node.props['fillcolor'] = recolor_dict[r_id]
+    for r_id, color in recolor_dict.items():
+        for node in g.nodes_original_id_dict.get(r_id, ()):
+            node.props['fillcolor'] = color
     return g
 
 
@@ -496,6 +563,12 @@ def add_node_label(g, cpd_detail, rxn_detail):
             element, this element is a reaction properties name list,
             e.g. detail = [['id', genes', 'equation']].
     """
+    # Labels derived from an entry are memoized by entry id; the same
+    # compound or reaction entry backs several nodes when reactions are
+    # split or duplicated, and the join over properties is not free.
+    cpd_pre_label_cache = {}
+    rxn_label_cache = {}
+
     for node in g.nodes:
         if node.props['type'] == 'cpd':
             node.props['label'] = node.props['id']
@@ -506,10 +579,14 @@ def add_node_label(g, cpd_detail, rxn_detail):
         # update node label based on what users provide in command line
         if cpd_detail is not None:
             if node.props['type'] == 'cpd':
-                pre_label = '\n'.join(
-                    (node.props['entry'][0].properties.get(value)) for
-                    value in cpd_detail[0] if value != 'id' and
-                    value in node.props['entry'][0].properties)
+                entry = node.props['entry'][0]
+                pre_label = cpd_pre_label_cache.get(entry.id)
+                if pre_label is None:
+                    pre_label = '\n'.join(
+                        (entry.properties.get(value)) for
+                        value in cpd_detail[0] if value != 'id' and
+                        value in entry.properties)
+                    cpd_pre_label_cache[entry.id] = pre_label
                 if 'id' in cpd_detail[0]:
                     label = u'{}\n{}'.format(node.props['id'], pre_label)
                 else:
@@ -525,21 +602,24 @@ def add_node_label(g, cpd_detail, rxn_detail):
         if rxn_detail is not None:
             if node.props['type'] == 'rxn':
                 if len(node.props['entry']) == 1:
-                    pre_label = u'\n'.join(
-                        node.props['entry'][0].properties.get(value)
-                        for value in rxn_detail[0] if
-                        value != 'equation' and
-                        value != 'id' and value in
-                        node.props['entry'][0].properties)
-                    if 'id' in rxn_detail[0]:
-                        label = u'{}\n{}'.format(
-                            node.props['entry'][0].properties['id'], pre_label)
-                    else:
-                        label = pre_label
-
-                    if 'equation' in rxn_detail[0]:
-                        label += u'\n{}'.format(
-                            node.props['entry'][0].properties.get('equation'))
+                    entry = node.props['entry'][0]
+                    label = rxn_label_cache.get(entry.id)
+                    if label is None:
+                        pre_label = u'\n'.join(
+                            entry.properties.get(value)
+                            for value in rxn_detail[0] if
+                            value != 'equation' and
+                            value != 'id' and value in entry.properties)
+                        if 'id' in rxn_detail[0]:
+                            label = u'{}\n{}'.format(
+                                entry.properties['id'], pre_label)
+                        else:
+                            label = pre_label
+
+                        if 'equation' in rxn_detail[0]:
+                            label += u'\n{}'.format(
+                                entry.properties.get('equation'))
+                        rxn_label_cache[entry.id] = label
 
                     # if all required properties are not in the reaction entry,
                     # then print reaction id
@@ -568,10 +648,9 @@ def make_cpt_tree(boundaries, extracellular):
         extracellular: the extracellular compartment in the model.
     """
     children = defaultdict(set)
-    compartments = set()
-    for (j, k) in boundaries:
-        compartments.add(j)
-        compartments.add(k)
+    # Flatten the boundary tuples in one C-level pass instead of two
+    # set.add calls per boundary.
+    compartments = set(chain.from_iterable(boundaries))
     if extracellular not in compartments:
         etmp = sorted(list(compartments), reverse=True)
         extracellular = etmp[0]
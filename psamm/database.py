@@ -169,6 +169,18 @@ class DictDatabase(MetabolicDatabase):
         self._compound_reactions = defaultdict(set)
         self._reversible = set()
 
+    @classmethod
+    def from_iter(cls, it):
+        """Create database from an iterable of reaction ID, equation pairs.
+
+        The pairs are streamed directly into the database so no intermediate
+        collection of the reactions has to be materialized by the caller.
+        """
+        database = cls()
+        for reaction_id, equation in it:
+            database.set_reaction(reaction_id, equation)
+        return database
+
     @property
     def reactions(self):
         return iter(self._reactions)
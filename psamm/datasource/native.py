@@ -584,12 +584,11 @@ class NativeModel(object):
             return Reaction(reaction.direction, left, right)
 
         # Create metabolic model
-        database = DictDatabase()
-        for reaction in self.reactions:
-            if reaction.equation is not None:
-                equation = _translate_compartments(
-                    reaction.equation, self.default_compartment)
-                database.set_reaction(reaction.id, equation)
+        database = DictDatabase.from_iter(
+            (reaction.id, _translate_compartments(
+                reaction.equation, self.default_compartment))
+            for reaction in self.reactions
+            if reaction.equation is not None)
 
         undefined_compartments = set()
         undefined_compounds = set()
@@ -861,13 +860,13 @@ def parse_reaction(reaction_def, default_compartment, context=None):
         else:
             reaction_props[key] = value
 
-    if 'genes' in reaction_def.keys():
+    if 'genes' in reaction_def:
         if isinstance(reaction_def['genes'], list):
             reaction_props['genes'] = [convert_to_unicode(gene)
                                        for gene in reaction_def['genes']]
 
     # Parse reaction equation
-    if 'equation' in reaction_def.keys():
+    if 'equation' in reaction_def:
         reaction_props['equation'] = parse_reaction_equation(
             reaction_def['equation'], default_compartment)
 
@@ -87,11 +87,23 @@ _COBRA_DECODE_ESCAPES = {
 }
 
 
+# Cache of qualified tag names. The same small set of tags is looked up for
+# every element, so the names are built once instead of being formatted on
+# each access.
+_TAG_CACHE = {}
+
+
 def _tag(tag, namespace=None):
     """Prepend namespace to tag name"""
-    if namespace is None:
-        return text_type(tag)
-    return '{{{}}}{}'.format(namespace, tag)
+    key = tag, namespace
+    qname = _TAG_CACHE.get(key)
+    if qname is None:
+        if namespace is None:
+            qname = text_type(tag)
+        else:
+            qname = '{{{}}}{}'.format(namespace, tag)
+        _TAG_CACHE[key] = qname
+    return qname
 
 
 class ParseError(Exception):
@@ -140,8 +152,9 @@ class SBMLSpeciesEntry(_SBMLEntry, BaseCompoundEntry):
     def __init__(self, reader, root, filemark=None):
         super(SBMLSpeciesEntry, self).__init__(reader, root)
 
-        self._name = root.get('name')
-        self._comp = root.get('compartment')
+        attrib = root.attrib
+        self._name = attrib.get('name')
+        self._comp = attrib.get('compartment')
 
         if self._comp is None:
             msg = 'Species {} has no compartment!'.format(self.id)
@@ -150,7 +163,7 @@ class SBMLSpeciesEntry(_SBMLEntry, BaseCompoundEntry):
             else:
                 logger.warning(msg)
 
-        self._boundary = root.get('boundaryCondition', 'false') == 'true'
+        self._boundary = attrib.get('boundaryCondition', 'false') == 'true'
 
         # In non-strict mode the species that ends with _b are considered
         # boundary conditions.
@@ -184,14 +197,15 @@ class SBMLSpeciesEntry(_SBMLEntry, BaseCompoundEntry):
     @property
     def charge(self):
         """Species charge"""
+        attrib = self._root.attrib
         if self._reader._level == 3:
             # Look for FBC charge
             for ns in (FBC_V2, FBC_V1):
-                charge = self._root.get(_tag('charge', ns))
+                charge = attrib.get(_tag('charge', ns))
                 if charge is not None:
                     return self._parse_charge_string(charge)
         else:
-            charge = self._root.get('charge')
+            charge = attrib.get('charge')
             if charge is not None:
                 return self._parse_charge_string(charge)
 
@@ -201,8 +215,9 @@ class SBMLSpeciesEntry(_SBMLEntry, BaseCompoundEntry):
     def formula(self):
         """Species formula"""
         if self._reader._level == 3:
+            attrib = self._root.attrib
             for ns in (FBC_V2, FBC_V1):
-                formula = self._root.get(_tag('chemicalFormula', ns))
+                formula = attrib.get(_tag('chemicalFormula', ns))
                 if formula is not None:
                     return formula
 
@@ -216,12 +231,13 @@ class SBMLSpeciesEntry(_SBMLEntry, BaseCompoundEntry):
     @property
     def properties(self):
         """All species properties as a dict"""
+        attrib = self._root.attrib
         properties = {'id': self._id,
                       'boundary': self._boundary}
-        if 'name' in self._root.attrib:
-            properties['name'] = self._root.get('name')
-        if 'compartment' in self._root.attrib:
-            properties['compartment'] = self._root.get('compartment')
+        if 'name' in attrib:
+            properties['name'] = attrib['name']
+        if 'compartment' in attrib:
+            properties['compartment'] = attrib['compartment']
 
         charge = self.charge
         if charge is not None:
@@ -311,9 +327,8 @@ class SBMLReactionEntry(_SBMLEntry, BaseReactionEntry):
 
     def _parse_species_references(self, name):
         """Yield species id and parsed value for a speciesReference list"""
-        for species in self._root.iterfind('./{}/{}'.format(
-                self._reader._sbml_tag(name),
-                self._reader._sbml_tag('speciesReference'))):
+        for species in self._root.iterfind(
+                self._reader._species_ref_paths[name]):
 
             species_id = species.get('species')
 
@@ -324,7 +339,10 @@ class SBMLReactionEntry(_SBMLEntry, BaseReactionEntry):
                 try:
                     value = int(species.get('stoichiometry', 1))
                     denom = int(species.get('denominator', 1))
-                    species_value = Fraction(value, denom)
+                    if denom == 1:
+                        species_value = value
+                    else:
+                        species_value = Fraction(value, denom)
                 except ValueError:
                     message = ('Non-integer stoichiometry is not allowed in'
                                ' SBML level 1 (reaction {})'.format(self.id))
@@ -343,7 +361,13 @@ class SBMLReactionEntry(_SBMLEntry, BaseReactionEntry):
                                          'speciesReference is not implemented')
                     species_value = 1
                 else:
-                    species_value = Decimal(value_str)
+                    # Most coefficients in real models are small integers, so
+                    # try the cheap int conversion before falling back to
+                    # Decimal.
+                    try:
+                        species_value = int(value_str)
+                    except ValueError:
+                        species_value = Decimal(value_str)
             elif self._reader._level == 3:
                 # Stoichiometric value is a double but can alternatively be
                 # specified using initial assignment (not implemented).
@@ -351,7 +375,10 @@ class SBMLReactionEntry(_SBMLEntry, BaseReactionEntry):
                 if value_str is None:
                     raise ParseError('Missing stoichiometry in'
                                      ' speciesReference is not implemented')
-                species_value = Decimal(value_str)
+                try:
+                    species_value = int(value_str)
+                except ValueError:
+                    species_value = Decimal(value_str)
 
             if species_value % 1 == 0:
                 species_value = int(species_value)
@@ -571,7 +598,7 @@ class SBMLReader(object):
     useful to extract specific information from those species objects.
 
     Args:
-        file: File-like object to parse XML SBML content from.
+        file: File-like object or bytes to parse XML SBML content from.
         strict: Indicating whether strict parsing is enabled.
         ignore_boundary: Indicating whether boundary species are dropped.
         context: Optional file parsing context from
@@ -581,8 +608,12 @@ class SBMLReader(object):
     def __init__(self, file, strict=False, ignore_boundary=True,
                  context=None):
         # Parse SBML file
-        tree = ETree.parse(file)
-        root = tree.getroot()
+        if isinstance(file, bytes):
+            # Parse an in-memory document directly instead of requiring the
+            # caller to wrap it in a stream.
+            root = ETree.fromstring(file)
+        else:
+            root = ETree.parse(file).getroot()
 
         self._strict = strict
         self._ignore_boundary = ignore_boundary
@@ -631,6 +662,13 @@ class SBMLReader(object):
             self._level = 1
             self._sbml_tag = partial(_tag, namespace=SBML_NS_L1)
 
+        # The species reference paths are the same for every reaction in the
+        # document, so they are built once here instead of per reaction.
+        self._species_ref_paths = {
+            name: './{}/{}'.format(
+                self._sbml_tag(name), self._sbml_tag('speciesReference'))
+            for name in ('listOfReactants', 'listOfProducts')}
+
         self._model = root.find(self._sbml_tag('model'))
 
         # Parameters
@@ -1517,6 +1555,12 @@ def convert_model_entries(
         model.default_compartment = compartment_map.get(old_id, old_id)
 
 
+# Patterns for key/value pairs in XHTML notes, compiled once instead of per
+# text block.
+_NOTES_KEY_VALUE_RE = re.compile(r'^([^:]+):(.+)$')
+_NOTES_QUOTED_RE = re.compile(r'^"(.*)"$')
+
+
 def parse_xhtml_notes(entry):
     """Yield key, value pairs parsed from the XHTML notes section.
 
@@ -1530,12 +1574,12 @@ def parse_xhtml_notes(entry):
         entry: :class:`_SBMLEntry`.
     """
     for note in entry.xml_notes.itertext():
-        m = re.match(r'^([^:]+):(.+)$', note)
+        m = _NOTES_KEY_VALUE_RE.match(note)
         if m:
             key, value = m.groups()
             key = key.strip().lower().replace(' ', '_')
             value = value.strip()
-            m = re.match(r'^"(.*)"$', value)
+            m = _NOTES_QUOTED_RE.match(value)
             if m:
                 value = m.group(1)
             if value != '':
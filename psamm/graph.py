@@ -21,8 +21,9 @@
 from __future__ import unicode_literals
 
 from itertools import count
-from six import iteritems, text_type
-from collections import defaultdict, Counter
+import numpy as np
+from six import text_type
+from collections import defaultdict
 
 from . import findprimarypairs
 
@@ -37,12 +38,16 @@ logger = logging.getLogger(__name__)
 
 def _graphviz_prop_string(d):
     return ','.join('{}="{}"'.format(k, text_type(v)) for k, v
-                    in sorted(iteritems(d)))
+                    in sorted(d.items()))
 
 
 class Entity(object):
     """Base class for graph entities."""
 
+    # Graphs of genome-scale models hold tens of thousands of entities;
+    # slots avoid a per-instance attribute dict.
+    __slots__ = ('_props',)
+
     def __init__(self, props={}):
         self._props = dict(props)
 
@@ -99,6 +104,14 @@ class Graph(Entity):
         """
         return self._nodes_id[node_id]
 
+    def add_nodes(self, nodes):
+        """add multiple nodes to a Graph entity in one call.
+        nodes: iterable of Node entities.
+        """
+        add_node = self.add_node
+        for node in nodes:
+            add_node(node)
+
     def add_edge(self, edge):
         if edge.source not in self._nodes or edge.dest not in self._nodes:
             raise ValueError('Edge nodes not in graph')
@@ -112,6 +125,15 @@ class Graph(Entity):
         self._node_edges.setdefault(edge.dest, {}).setdefault(
             edge.source, set()).add(edge)
 
+    def add_edges(self, edges):
+        """add multiple edges to a Graph entity in one call.
+        edges: iterable of Edge entities; all nodes of the edges must
+            already be in the graph.
+        """
+        add_edge = self.add_edge
+        for edge in edges:
+            add_edge(edge)
+
     @property
     def nodes(self):
         return iter(self._nodes)
@@ -130,7 +152,7 @@ class Graph(Entity):
 
     @property
     def edges(self):
-        for pair, edges in iteritems(self._edges):
+        for pair, edges in self._edges.items():
             for edge in edges:
                 yield edge
 
@@ -139,7 +161,7 @@ class Graph(Entity):
         return self._edge_count
 
     def edges_for(self, node):
-        return iteritems(self._node_edges.get(node, {}))
+        return iter(self._node_edges.get(node, {}).items())
 
     @property
     def default_node_props(self):
@@ -174,7 +196,7 @@ class Graph(Entity):
             f.write(' edge[{}];\n'.format(
                     _graphviz_prop_string(self._default_edge_props)))
 
-        for k, v in iteritems(self.props):
+        for k, v in self.props.items():
             f.write(' {}="{}";\n'.format(k, v))
 
         for node in sorted(self.nodes, key=lambda k: k.props['id']):
@@ -220,7 +242,7 @@ class Graph(Entity):
             f.write(' edge[{}];\n'.format(
                     _graphviz_prop_string(self._default_edge_props)))
 
-        for k, v in iteritems(self.props):
+        for k, v in self.props.items():
             f.write(' {}="{}";\n'.format(k, v))
 
         next_id = count(0)
@@ -312,8 +334,6 @@ class Graph(Entity):
         f.write('\t'.join(properties) + '\n')
 
         for node in sorted(self.nodes, key=lambda k: k.props['id']):
-            # a = '\t'.join(text_type(node.props.get(x))
-            #               for x in properties if x != 'label')
             a = '\t'.join(text_type(node.props.get(x))
                           for x in properties if x not in ['label', 'entry'])
             b = node.props['label'].replace('\n', ',')
@@ -350,6 +370,7 @@ class Graph(Entity):
 
 class Node(Entity):
     """Node entity represents a vertex in the graph."""
+    __slots__ = ()
     __hash__ = Entity.__hash__
 
     def __init__(self, props={}):
@@ -367,6 +388,7 @@ class Node(Entity):
 
 class Edge(Entity):
     """Edge entity represents a connection between nodes."""
+    __slots__ = ('source', 'dest')
     __hash__ = Entity.__hash__
 
     def __init__(self, source, dest, props={}):
@@ -399,29 +421,39 @@ def get_compound_dict(model):
         model: <class 'psamm.datasource.native.NativeModel'>
     """
     compound_formula = {}
+    # Identical formula strings (e.g. H2O) recur across many compounds, so
+    # parse each distinct string only once.
+    parsed = {}
     for compound in model.compounds:
-        if compound.formula is not None:
+        formula = compound.formula
+        if formula is None:
+            continue
+        f = parsed.get(formula)
+        if f is None:
             try:
-                f = Formula.parse(compound.formula).flattened()
-                if not f.is_variable():
-                    compound_formula[compound.id] = f
-                else:
-                    logger.warning(
-                        'Skipping variable formula {}: {}'.format(
-                            compound.id, compound.formula))
+                f = Formula.parse(formula).flattened()
             except ParseError as e:
                 msg = (
                     'Error parsing formula'
                     ' for compound {}:\n{}\n{}'.format(
-                        compound.id, e, compound.formula))
+                        compound.id, e, formula))
                 if e.indicator is not None:
                     msg += '\n{}'.format(e.indicator)
                 logger.warning(msg)
+                continue
+            parsed[formula] = f
+        if not f.is_variable():
+            compound_formula[compound.id] = f
+        else:
+            logger.warning(
+                'Skipping variable formula {}: {}'.format(
+                    compound.id, formula))
     return compound_formula
 
 
 def make_network_dict(nm, mm, subset=None, method='fpp', element=None,
-                      excluded_reactions=[], reaction_dict={}, analysis=None):
+                      excluded_reactions=[], reaction_dict={}, analysis=None,
+                      compound_formula=None):
     """Create a dictionary of reactant/product pairs to reaction directions.
 
     Returns a dictionary that connects predicted reactant/product pairs
@@ -444,14 +476,23 @@ def make_network_dict(nm, mm, subset=None, method='fpp', element=None,
             empty dictionary.
         analysis: "None" type or a string indicates if FBA or FVA file is
             given in command line.
+        compound_formula: optional dictionary of compound id to Formula,
+            as returned by get_compound_dict. Passing one saves re-parsing
+            the formulas when the caller already has it.
     """
-    compound_formula = get_compound_dict(nm)
+    if compound_formula is None:
+        compound_formula = get_compound_dict(nm)
     if not compound_formula and (method == 'fpp' or element):
-        logger.error(
+        raise ValueError(
             'Compound formulas are required for fpp or specific element '
             'visualizations, try --element all to visualize all pathways '
             'without compound formula input.')
-        exit(1)
+
+    # Make sure the membership tests below run against sets; the caller
+    # may pass any iterable for the subset and the exclude list.
+    if subset is not None and not isinstance(subset, (set, frozenset)):
+        subset = frozenset(subset)
+    excluded_reactions = frozenset(excluded_reactions)
 
     if subset is not None:
         testing_list_raw = []
@@ -475,11 +516,10 @@ def make_network_dict(nm, mm, subset=None, method='fpp', element=None,
     for rxn in testing_list_raw:
         flux = 0
         style = 'solid' if analysis is None else 'dotted'
-        # direction = nm.reactions[rxn].equation.direction
-        direction = mm.get_reaction(rxn).direction
+        reaction = mm.get_reaction(rxn)
+        direction = reaction.direction
         if rxn in reaction_dict:
             style = 'solid'
-            reaction = mm.get_reaction(rxn)
             lower = reaction_dict[rxn][0]
             upper = reaction_dict[rxn][1]
             flux = lower * upper
@@ -509,68 +549,87 @@ def make_network_dict(nm, mm, subset=None, method='fpp', element=None,
             reaction_data[rxn] = (nm.reactions[rxn], direction)
         style_flux_dict[rxn] = (style, abs(flux))
 
-    flux_list = sorted([f for s, f in style_flux_dict.values()])
-    median = 1
-    flux_list = list(filter(lambda x: x != 0, flux_list))
-
     testing_list = [rxn for rxn in testing_list_raw if not mm.is_exchange(rxn)]
 
+    # Median of the non-zero fluxes; np.median selects in C instead of
+    # fully sorting the flux list in Python.
+    flux_list = [f for s, f in style_flux_dict.values() if f != 0]
+    median = 1
     if flux_list:
-        mid = len(flux_list) // 2
-        median = flux_list[mid] if len(flux_list) % 2 else float(
-            flux_list[mid-1] + flux_list[mid]) / 2.0
-        if median < 1:
-            median = 1
-
-    for rxn, (style, flux) in style_flux_dict.items():
-        new_flux = float(5 * flux) / float(median)
-        new_flux = max(min(10, new_flux), 1)
-        style_flux_dict.update({rxn: (style, new_flux)})
+        median = max(1, float(np.median(flux_list)))
+
+    # Scale all edge widths in one vectorized clip instead of a Python
+    # min/max per reaction.
+    rxn_ids = list(style_flux_dict)
+    fluxes = np.fromiter(
+        (style_flux_dict[rxn][1] for rxn in rxn_ids),
+        dtype=np.float64, count=len(rxn_ids))
+    widths = np.clip(5.0 * fluxes / float(median), 1.0, 10.0)
+    for rxn, width in zip(rxn_ids, widths):
+        style_flux_dict[rxn] = (style_flux_dict[rxn][0], float(width))
+
+    # Hoist the Atom construction out of the pair loops below; building it
+    # per pair costs a parse and hash for every single membership test.
+    target_atom = Atom(element) if element is not None else None
+
+    # Resolve which compounds contain the target element once, so the pair
+    # loops test set membership on the compound name instead of probing the
+    # Formula object again for every occurrence of the compound.
+    if target_atom is not None:
+        cpds_with_atom = frozenset(
+            name for name, formula in compound_formula.items()
+            if target_atom in formula)
+    else:
+        cpds_with_atom = None
 
     full_pairs_dict = {}
     if method == 'fpp':
         element_weight = findprimarypairs.element_weight
-        testing_list_update = []
+        # Fetch each reaction entry once; the check and the pair list both
+        # need the same equation.
+        reaction_pairs = []
         for r in testing_list:
+            equation = nm.reactions[r].equation
             if all(cpd.name in compound_formula
-                   for cpd, _ in nm.reactions[r].equation.compounds):
-                testing_list_update.append(r)
+                   for cpd, _ in equation.compounds):
+                reaction_pairs.append((r, equation))
             else:
                 logger.warning(
                     'Reaction {} is excluded from visualization due to '
                     'missing or undefined compound formula'.format(r))
-        reaction_pairs = [(r, nm.reactions[r].equation)
-                          for r in testing_list_update]
         fpp_dict, _ = findprimarypairs.predict_compound_pairs_iterated(
             reaction_pairs, compound_formula, element_weight=element_weight)
 
-        for rxn_id, fpp_pairs in iteritems(fpp_dict):
-            compound_pairs = []
-            for cpd_pair, transfer in iteritems(fpp_pairs[0]):
-                if element is None:
-                    compound_pairs.append(cpd_pair)
-                else:
-                    if any(Atom(element) in k for k in transfer):
-                        compound_pairs.append(cpd_pair)
+        for rxn_id, fpp_pairs in fpp_dict.items():
+            if target_atom is None:
+                compound_pairs = list(fpp_pairs[0])
+            else:
+                compound_pairs = [
+                    cpd_pair for cpd_pair, transfer in fpp_pairs[0].items()
+                    if any(target_atom in k for k in transfer)]
             (rxn_entry, rxn_dir) = reaction_data[rxn_id]
             full_pairs_dict[rxn_entry] = (sorted(compound_pairs), rxn_dir)
 
     elif method == 'no-fpp':
         for reaction in testing_list:
-            compound_pairs = []
-            for substrate in nm.reactions[reaction].equation.left:
-                for product in nm.reactions[reaction].equation.right:
-                    if element is None:
-                        compound_pairs.append((substrate[0], product[0]))
-                    else:
-                        if Atom(element) in \
-                                compound_formula[substrate[0].name] and \
-                                Atom(element) in \
-                                compound_formula[product[0].name]:
-                            compound_pairs.append((substrate[0], product[0]))
-            full_pairs_dict[nm.reactions[reaction]] = \
-                (sorted(compound_pairs),
-                 nm.reactions[reaction].equation.direction)
+            rxn_entry = nm.reactions[reaction]
+            equation = rxn_entry.equation
+            # Filter each side for the target element before taking the
+            # product, so each compound is tested once instead of once per
+            # pair.
+            if element is None:
+                substrates = [c for c, _ in equation.left]
+                products = [c for c, _ in equation.right]
+            else:
+                substrates = [c for c, _ in equation.left
+                              if c.name in cpds_with_atom]
+                products = [c for c, _ in equation.right
+                            if c.name in cpds_with_atom]
+            compound_pairs = [
+                (substrate, product)
+                for substrate in substrates for product in products]
+            full_pairs_dict[rxn_entry] = \
+                (sorted(compound_pairs), equation.direction)
 
     return full_pairs_dict, style_flux_dict
 
@@ -587,14 +646,15 @@ def write_network_dict(network_dict):
      Args:
          network_dict: Dictionary object from make_network_dict()
      """
-    for key, value in sorted(iteritems(network_dict), key=lambda x: str(x)):
+    for key, value in sorted(network_dict.items(), key=lambda x: str(x)):
         (cpair_list, dir) = value
+        dir_str = dir_value(dir)
         for (c1, c2) in cpair_list:
-            print('{}\t{}\t{}\t{}'.format(key.id, c1, c2, dir_value(dir)))
+            print('{}\t{}\t{}\t{}'.format(key.id, c1, c2, dir_str))
 
 
 def make_cpair_dict(filter_dict, args_method, args_combine, style_flux_dict,
-                    hide_edges=[]):
+                    hide_edges=frozenset()):
     """Create a mapping from compound pair to a defaultdict containing
     lists of reactions for the forward, reverse, and both directions.
 
@@ -612,64 +672,83 @@ def make_cpair_dict(filter_dict, args_method, args_combine, style_flux_dict,
         args_combine: combine level, default = 0, optional: 1 and 2.
         style_flux_dict: a dictionary to set the edge style when fba or
             fva input is given.
-        hide_edges: to determine edges between which compound pair need
-            to be hidden.
+        hide_edges: set of (compound ID, compound ID) tuples determining
+            edges between which compound pairs need to be hidden.
     """
 
     new_id_mapping = {}
     new_style_flux_dict = {}
-    rxn_count = Counter()
     cpair_dict = defaultdict(lambda: defaultdict(list))
 
     def make_mature_cpair_dict(cpair_dict, hide):
         new_cpair_dict = {}
-        cpair_list = []
-        for (c1, c2), rxns in sorted(iteritems(cpair_dict)):
-            if (c1, c2) not in cpair_list and (text_type(c1),
-                                               text_type(c2)) not in hide:
-                new_rxns = rxns
-                if (c2, c1) in cpair_dict:
-                    if len(cpair_dict[(c2, c1)]['forward']) > 0:
-                        for r in cpair_dict[(c2, c1)]['forward']:
-                            new_rxns['back'].append(r)
-                    if len(cpair_dict[(c2, c1)]['back']) > 0:
-                        for r in cpair_dict[(c2, c1)]['back']:
-                            new_rxns['forward'].append(r)
-                    if len(cpair_dict[(c2, c1)]['both']) > 0:
-                        for r in cpair_dict[(c2, c1)]['both']:
-                            new_rxns['both'].append(r)
+        cpair_set = set()
+
+        # Stringifying a Compound is not free and the same compound shows
+        # up in many pairs; cache the text per compound and skip the
+        # conversion entirely when there is nothing to hide.
+        cpd_text = {}
+
+        def _text(c):
+            r = cpd_text.get(c)
+            if r is None:
+                r = cpd_text[c] = text_type(c)
+            return r
+
+        # Sort the keys only; sorting items() would allocate a tuple per
+        # pair and fall back to comparing the value dicts on ties.
+        for (c1, c2) in sorted(cpair_dict):
+            if (c1, c2) not in cpair_set and (
+                    not hide or (_text(c1), _text(c2)) not in hide):
+                new_rxns = cpair_dict[(c1, c2)]
+                # Look up the opposite pair once instead of re-hashing
+                # (c2, c1) for each direction list.
+                opposite = cpair_dict.get((c2, c1))
+                if opposite is not None:
+                    for new_dir, opp_dir in (('back', 'forward'),
+                                             ('forward', 'back'),
+                                             ('both', 'both')):
+                        merged = opposite.get(opp_dir)
+                        if merged:
+                            new_rxns[new_dir].extend(merged)
                     new_cpair_dict[(c1, c2)] = new_rxns
-                    cpair_list.append((c1, c2))
-                    cpair_list.append((c2, c1))
+                    cpair_set.update(((c1, c2), (c2, c1)))
                 else:
                     new_cpair_dict[(c1, c2)] = new_rxns
-                    cpair_list.append((c1, c2))
+                    cpair_set.add((c1, c2))
 
         rxns_sorted_cpair_dict = defaultdict(lambda: defaultdict(list))
-        for (c1, c2), rxns in sorted(iteritems(new_cpair_dict)):
-            for direction, rlist in iteritems(rxns):
+        for (c1, c2) in sorted(new_cpair_dict):
+            rxns = new_cpair_dict[(c1, c2)]
+            for direction, rlist in rxns.items():
                 rxns_sorted_cpair_dict[(c1, c2)][direction] = sorted(rlist)
 
         return rxns_sorted_cpair_dict
 
     if args_method != 'no-fpp':
         if args_combine == 0:
-            for rxn, cpairs_dir in iteritems(filter_dict):
+            for rxn, cpairs_dir in filter_dict.items():
                 have_visited = set()
                 sub_pro = defaultdict(list)
                 rxn_mixcpairs = defaultdict(list)
+                # Each reaction is visited once, so a plain local counter
+                # replaces the Counter increment; the id string and style
+                # tuple are likewise fixed per reaction.
+                rxn_suffix = 0
+                rxn_id_raw = rxn.id
+                rxn_style = style_flux_dict[rxn_id_raw]
                 for (c1, c2) in sorted(cpairs_dir[0]):
                     sub_pro[c1].append(c2)
-                for k1, v1 in sorted(iteritems(sub_pro)):
+                for k1, v1 in sorted(sub_pro.items()):
                     if k1 not in have_visited:
-                        rxn_count[rxn] += 1
+                        rxn_suffix += 1
                         have_visited.add(k1)
-                        r_id = '{}_{}'.format(rxn.id, rxn_count[rxn])
+                        r_id = '{}_{}'.format(rxn_id_raw, rxn_suffix)
                         new_id_mapping[r_id] = rxn
-                        new_style_flux_dict[r_id] = style_flux_dict[rxn.id]
+                        new_style_flux_dict[r_id] = rxn_style
                         for v in v1:
                             rxn_mixcpairs[r_id].append((k1, v))
-                        for k2, v2 in iteritems(sub_pro):
+                        for k2, v2 in sub_pro.items():
                             if k2 not in have_visited:
                                 if k2 != k1:
                                     if v1 == v2:
@@ -677,28 +756,29 @@ def make_cpair_dict(filter_dict, args_method, args_combine, style_flux_dict,
                                         for vtest in v2:
                                             rxn_mixcpairs[r_id].append(
                                                 (k2, vtest))
-                for rxn_id, cpairs in iteritems(rxn_mixcpairs):
+                for rxn_id, cpairs in rxn_mixcpairs.items():
                     for (c1, c2) in cpairs:
-                        if cpairs_dir[1] == Direction.Forward:
+                        if cpairs_dir[1] is Direction.Forward:
                             cpair_dict[(c1, c2)]['forward'].append(rxn_id)
-                        elif cpairs_dir[1] == Direction.Reverse:
+                        elif cpairs_dir[1] is Direction.Reverse:
                             cpair_dict[(c1, c2)]['back'].append(rxn_id)
                         else:
                             cpair_dict[(c1, c2)]['both'].append(rxn_id)
 
         elif args_combine == 1 or args_combine == 2:
-            for rxn, cpairs_dir in iteritems(filter_dict):
+            for rxn, cpairs_dir in filter_dict.items():
                 cpd_rid = {}
                 have_visited = set()
+                rxn_suffix = 0
+                rxn_id_raw = rxn.id
+                rxn_style = style_flux_dict[rxn_id_raw]
                 for (c1, c2) in sorted(cpairs_dir[0]):
                     if c1 not in have_visited:
                         if c2 not in have_visited:
-                            rxn_count[rxn] += 1
-                            rxn_id = '{}_{}'.format(
-                                rxn.id, rxn_count[rxn])
+                            rxn_suffix += 1
+                            rxn_id = '{}_{}'.format(rxn_id_raw, rxn_suffix)
                             new_id_mapping[rxn_id] = rxn
-                            new_style_flux_dict[rxn_id] = \
-                                style_flux_dict[rxn.id]
+                            new_style_flux_dict[rxn_id] = rxn_style
                             have_visited.add(c1)
                             have_visited.add(c2)
                             cpd_rid[c1] = rxn_id
@@ -712,21 +792,21 @@ def make_cpair_dict(filter_dict, args_method, args_combine, style_flux_dict,
                         have_visited.add(c2)
                         cpd_rid[c2] = rxn_id
 
-                    if cpairs_dir[1] == Direction.Forward:
+                    if cpairs_dir[1] is Direction.Forward:
                         cpair_dict[(c1, c2)]['forward'].append(rxn_id)
-                    elif cpairs_dir[1] == Direction.Reverse:
+                    elif cpairs_dir[1] is Direction.Reverse:
                         cpair_dict[(c1, c2)]['back'].append(rxn_id)
                     else:
                         cpair_dict[(c1, c2)]['both'].append(rxn_id)
     else:
-        for rxn, cpairs_dir in iteritems(filter_dict):
+        for rxn, cpairs_dir in filter_dict.items():
             for (c1, c2) in cpairs_dir[0]:
                 r_id = rxn.id
                 new_id_mapping[r_id] = rxn
                 new_style_flux_dict[r_id] = style_flux_dict[rxn.id]
-                if cpairs_dir[1] == Direction.Forward:
+                if cpairs_dir[1] is Direction.Forward:
                     cpair_dict[(c1, c2)]['forward'].append(r_id)
-                elif cpairs_dir[1] == Direction.Reverse:
+                elif cpairs_dir[1] is Direction.Reverse:
                     cpair_dict[(c1, c2)]['back'].append(r_id)
                 else:
                     cpair_dict[(c1, c2)]['both'].append(r_id)
@@ -764,6 +844,16 @@ def make_bipartite_graph_object(cpairs_dict, new_id_mapping, method,
     g._default_node_props['fontname'] = 'Arial'
     g._default_node_props['fontsize'] = 12
 
+    # Shared per-compound text cache for the node and edge passes; the
+    # same compound is stringified once instead of once per occurrence.
+    cpd_text = {}
+
+    def _text(c):
+        r = cpd_text.get(c)
+        if r is None:
+            r = cpd_text[c] = text_type(c)
+        return r
+
     def add_graph_nodes(g, cpairs_dict, method, new_id_mapping, args_combine,
                         model_compound_entries):
         """ Create compound and reaction nodes, adding them to
@@ -784,23 +874,24 @@ def make_bipartite_graph_object(cpairs_dict, new_id_mapping, method,
         return: A graph object that contains a set of nodes.
         """
         graph_nodes = set()
-        for cpair, reactions in sorted(iteritems(cpairs_dict)):
+        for cpair in sorted(cpairs_dict):
+            reactions = cpairs_dict[cpair]
             for c in cpair:
                 if c not in graph_nodes:
                     node = Node({
-                        'id': text_type(c),
+                        'id': _text(c),
                         'entry': [model_compound_entries[c.name]],
                         'compartment': c.compartment,
                         'type': 'cpd'})
                     g.add_node(node)
                     graph_nodes.add(c)
-            for direction, rlist in iteritems(reactions):
+            for direction, rlist in reactions.items():
                 if method != 'no-fpp' and args_combine == 2:
                     real_rxns = [new_id_mapping[r] for r in rlist]
-                    rxn_string = text_type(','.join(rlist))
+                    rxn_string = ','.join(rlist)
                     if rxn_string not in graph_nodes:
                         rnode = Node({
-                            'id': text_type(','.join(rlist)),
+                            'id': rxn_string,
                             'entry': real_rxns,
                             'compartment': c.compartment,
                             'type': 'rxn'})
@@ -811,7 +902,7 @@ def make_bipartite_graph_object(cpairs_dict, new_id_mapping, method,
                         rxn_ob = new_id_mapping[sub_rxn]
                         if sub_rxn not in graph_nodes:
                             rnode = Node({
-                                'id': text_type(sub_rxn),
+                                'id': sub_rxn,
                                 'entry': [rxn_ob],
                                 'compartment': c.compartment,
                                 'type': 'rxn'})
@@ -830,8 +921,6 @@ def make_bipartite_graph_object(cpairs_dict, new_id_mapping, method,
                 {'forward":[rx1], 'both':[rx2}}.
             method: Command line argument, options=
                 ['fpp', 'no-fpp', file_path].
-            # split: Command line argument, True or False.
-                By default split = False.
             args_combine: Command line argument, an
                 integer(could be 0, 1 or 2).
             new_style_flux_dict: A dictsionary of reaction is maps to edge
@@ -839,62 +928,64 @@ def make_bipartite_graph_object(cpairs_dict, new_id_mapping, method,
             analysis: "None" type or a string indicates if FBA or FVA file is
                 given in command line.
         """
-        edge_list = []
-        for (c1, c2), value in iteritems(cpairs_dict):
-            for direction, rlist in iteritems(value):
+        # Edge keys are tracked in a set; a list here would be scanned once
+        # per reaction-compound pair, which is quadratic on dense models.
+        edge_list = set()
+        get_node = g.get_node
+        for (c1, c2), value in cpairs_dict.items():
+            # The compound nodes are invariant over the direction and
+            # reaction loops below; look them up once per pair. The props
+            # dict can be shared since Edge copies it on construction.
+            c1_node = get_node(_text(c1))
+            c2_node = get_node(_text(c2))
+            for direction, rlist in value.items():
                 new_rlist = ','.join(rlist)
                 if args_combine == 0 or args_combine == 1 or \
                         method == 'no-fpp':
                     for sub_rxn in rlist:
+                        style, penwidth = new_style_flux_dict[sub_rxn]
+                        props = {'dir': direction, 'style': style,
+                                 'penwidth': penwidth}
+
                         test1 = c1, sub_rxn
                         if test1 not in edge_list:
-                            edge_list.append(test1)
+                            edge_list.add(test1)
                             g.add_edge(Edge(
-                                g.get_node(text_type(c1)),
-                                g.get_node(text_type(sub_rxn)),
-                                {'dir': direction,
-                                 'style': new_style_flux_dict[sub_rxn][0],
-                                 'penwidth': new_style_flux_dict[sub_rxn][1]}))
+                                c1_node, get_node(sub_rxn), props))
 
                         test2 = c2, sub_rxn
                         if test2 not in edge_list:
-                            edge_list.append(test2)
+                            edge_list.add(test2)
                             g.add_edge(Edge(
-                                g.get_node(text_type(sub_rxn)),
-                                g.get_node(text_type(c2)),
-                                {'dir': direction,
-                                 'style': new_style_flux_dict[sub_rxn][0],
-                                 'penwidth': new_style_flux_dict[sub_rxn][1]}))
+                                get_node(sub_rxn), c2_node, props))
 
                 else:
                     test1 = c1, new_rlist
                     test2 = c2, new_rlist
-                    sub_rxn = list(new_rlist.split(','))
-
-                    style_list = set(new_style_flux_dict[rxn][0] for rxn in
-                                     sub_rxn)
-                    style = style_list.pop() if len(set(style_list)) == 1 \
-                        else 'solid'
 
-                    flux = sum([new_style_flux_dict[rxn][1] for rxn in
-                                sub_rxn], 0) if analysis else 0
-                    flux = max(min(10, flux), 1)
+                    # One pass over the reaction list collects both the
+                    # style set and the summed width; splitting the joined
+                    # id string again is not needed.
+                    styles = set()
+                    flux = 0
+                    for rxn in rlist:
+                        rxn_style, rxn_width = new_style_flux_dict[rxn]
+                        styles.add(rxn_style)
+                        flux += rxn_width
+                    style = styles.pop() if len(styles) == 1 else 'solid'
+                    flux = max(min(10, flux), 1) if analysis else 1
+
+                    rxn_node = get_node(new_rlist)
+                    props = {'dir': direction, 'style': style,
+                             'penwidth': flux}
 
                     if test1 not in edge_list:
-                        edge_list.append(test1)
-                        g.add_edge(Edge(
-                            g.get_node(text_type(c1)),
-                            g.get_node(text_type(new_rlist)),
-                            {'dir': direction, 'style': style,
-                             'penwidth': flux}))
+                        edge_list.add(test1)
+                        g.add_edge(Edge(c1_node, rxn_node, props))
 
                     if test2 not in edge_list:
-                        edge_list.append(test2)
-                        g.add_edge(Edge(
-                            g.get_node(text_type(new_rlist)),
-                            g.get_node(text_type(c2)),
-                            {'dir': direction, 'style': style,
-                             'penwidth': flux}))
+                        edge_list.add(test2)
+                        g.add_edge(Edge(rxn_node, c2_node, props))
         return g
 
     g = add_graph_nodes(g, cpairs_dict, method, new_id_mapping,
@@ -906,33 +997,37 @@ def make_bipartite_graph_object(cpairs_dict, new_id_mapping, method,
 
 def make_compound_graph(network_dictionary):
     g = Graph()
-    compound_nodes = []
-    edge_list = []
-    for reaction, (cpair_list, dir) in iteritems(network_dictionary):
+    # A set gives O(1) membership tests; the list it replaces was scanned
+    # once per compound occurrence, making this loop quadratic.
+    compound_nodes = set()
+    edge_list = set()
+    for reaction, (cpair_list, dir) in network_dictionary.items():
+        # The direction string is the same for every pair of the reaction.
+        dir_str = dir_value(dir)
         for (c1, c2) in cpair_list:
             if c1 not in compound_nodes:
                 g.add_node(Node({'id': text_type(c1), 'entry': c1}))
-                compound_nodes.append(c1)
+                compound_nodes.add(c1)
             if c2 not in compound_nodes:
                 g.add_node(Node({'id': text_type(c2), 'entry': c2}))
-                compound_nodes.append(c2)
+                compound_nodes.add(c2)
             cpair_sorted = sorted([c1.name, c2.name])
             edge = Edge(g.get_node(text_type(c1)),
                         g.get_node(text_type(c2)),
                         props={'id': '{}_{}_{}'.format(
                             cpair_sorted[0], cpair_sorted[1],
-                            dir_value(dir)), 'dir': dir_value(dir)})
+                            dir_str), 'dir': dir_str})
             if edge.props['id'] not in edge_list:
                 g.add_edge(edge)
-                edge_list.append(edge.props['id'])
+                edge_list.add(edge.props['id'])
     return g
 
 
 def dir_value(direction):
     """ Assign value to different reaction directions"""
-    if direction == Direction.Forward:
+    if direction is Direction.Forward:
         return 'forward'
-    elif direction == Direction.Reverse:
+    elif direction is Direction.Reverse:
         return 'back'
     else:
         return 'both'
@@ -73,7 +73,7 @@ class Importer(BaseImporter):
     def _import(self, file, name):
         model_doc = loadmat(file)
         if name is None:
-            names = [k for k in model_doc.keys()
+            names = [k for k in model_doc
                      if k not in ['__header__', '__version__', '__globals__']]
             modelnames = list()
             for i in names:
@@ -91,7 +91,7 @@ class Importer(BaseImporter):
             else:
                 raise ModelLoadError('Incorrect format')
         else:
-            if name not in model_doc.keys():
+            if name not in model_doc:
                 raise ModelLoadError('Incorrect model name specified')
             else:
                 model_doc = model_doc[name]
@@ -114,6 +114,11 @@ class Problem(BaseProblem):
 
         self._cp.parameters.emphasis.numerical.set(True)
 
+        # Start reoptimizations from the previous basis so repeated solves
+        # with modified objectives (e.g. FVA) warm-start instead of
+        # re-factorizing from scratch.
+        self._cp.parameters.advance.set(1)
+
         self._variables = {}
         self._var_names = (i for i in count(0))
         self._constr_names = ('c'+str(i) for i in count(1))
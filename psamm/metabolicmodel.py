@@ -406,7 +406,7 @@ class MetabolicModel(MetabolicDatabase):
                     mm_irrev.limits[r2_id].upper = - lower
                     mm_irrev.limits[r2_id].lower = 0
 
-            elif rxn in lumped_rxns.keys():
+            elif rxn in lumped_rxns:
                 final_sub_rxn_list = []
                 sub = lumped_rxns[rxn]
                 check = 0
@@ -44,6 +44,11 @@ class Compound(object):
     polyphosphate(n)).
     """
 
+    # Compounds are created in large numbers when parsing models so the
+    # instances are slotted to reduce the memory and attribute access
+    # overhead.
+    __slots__ = ('_name', '_compartment', '_arguments')
+
     def __init__(self, name, compartment=None, arguments=()):
         self._name = name
         self._compartment = None
@@ -19,6 +19,8 @@
 
 from __future__ import unicode_literals
 
+import os
+import time
 import unittest
 
 from psamm.datasource import sbml, native, entry
@@ -27,14 +29,11 @@ from psamm.reaction import Reaction, Compound, Direction
 
 from decimal import Decimal
 from fractions import Fraction
-from six import BytesIO, itervalues
+from six import itervalues
 
 
-class TestSBMLDatabaseL1V2(unittest.TestCase):
-    """Test parsing of a simple level 1 version 2 SBML file"""
-
-    def setUp(self):
-        self.doc = BytesIO('''<?xml version="1.0" encoding="UTF-8"?>
+# Test documents, encoded once at import time.
+_DOC_L1V2 = b'''<?xml version="1.0" encoding="UTF-8"?>
 <sbml xmlns="http://www.sbml.org/sbml/level1"
       xmlns:html="http://www.w3.org/1999/xhtml"
       level="1" version="2">
@@ -81,14 +80,359 @@ class TestSBMLDatabaseL1V2(unittest.TestCase):
    </reaction>
   </listOfReactions>
  </model>
-</sbml>'''.encode('utf-8'))
+</sbml>'''
+
+_DOC_L2V5 = b'''<?xml version="1.0" encoding="UTF-8"?>
+<sbml xmlns="http://www.sbml.org/sbml/level2/version5"
+      level="2" version="5">
+ <model id="test_model" name="Test model">
+  <listOfCompartments>
+   <compartment id="C_c" name="cell"/>
+   <compartment id="C_b" name="boundary"/>
+  </listOfCompartments>
+  <listOfSpecies>
+   <species id="M_Glucose_LPAREN_c_RPAREN_" name="Glucose" compartment="C_c"
+            charge="0">
+    <notes>
+     <body xmlns="http://www.w3.org/1999/xhtml">
+      <p>FORMULA: C6H12O6</p>
+      <p>Charge: "0"</p>
+      <p>Additional notes..</p>
+      <p>KEGG ID: C00031</p>
+      <p>Custom: 123</p>
+     </body>
+    </notes>
+   </species>
+   <species id="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_" name="Glucose-6-P"
+            compartment="C_c" charge="-2"/>
+   <species id="M_H2O_LPAREN_c_RPAREN_" name="H2O" compartment="C_c"
+            charge="0"/>
+   <species id="M_Phosphate_LPAREN_c_RPAREN_" name="Phosphate"
+            compartment="C_c" boundaryCondition="false"/>
+   <species id="M_Biomass" name="Biomass" compartment="C_b"
+            boundaryCondition="true"/>
+  </listOfSpecies>
+  <listOfReactions>
+   <reaction id="R_G6Pase" reversible="true">
+    <listOfReactants>
+     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_" stoichiometry="2"/>
+     <speciesReference species="M_Phosphate_LPAREN_c_RPAREN_"
+                       stoichiometry="2"/>
+    </listOfReactants>
+    <listOfProducts>
+     <speciesReference species="M_H2O_LPAREN_c_RPAREN_" stoichiometry="2"/>
+     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
+                       stoichiometry="2"/>
+    </listOfProducts>
+    <notes>
+     <body xmlns="http://www.w3.org/1999/xhtml">
+      <p> Authors: Jane Doe ; John Doe </p>
+      <p>CONFIDENCE: 3</p>
+      <p>EC NUMBER: 3.1.3.9</p>
+      <p>gene association :   b0822 </p>
+      <p>SUBSYSTEM: "Glycolysis / Gluconeogenesis"</p>
+      <p>Additional notes...</p>
+     </body>
+    </notes>
+   </reaction>
+   <reaction id="R_Biomass" reversible="false">
+    <listOfReactants>
+     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
+                       stoichiometry="0.56"/>
+     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_"
+                       stoichiometry="0.88"/>
+    </listOfReactants>
+    <listOfProducts>
+     <speciesReference species="M_Biomass"/>
+    </listOfProducts>
+    <kineticLaw>
+     <listOfParameters>
+      <parameter id="LOWER_BOUND" value="0"/>
+      <parameter id="UPPER_BOUND" value="1000"/>
+      <parameter id="SOME_CUSTOM_PARAMETER" value="123.4"/>
+      <parameter id="OBJECTIVE_COEFFICIENT" value="1"/>
+     </listOfParameters>
+    </kineticLaw>
+   </reaction>
+  </listOfReactions>
+ </model>
+</sbml>'''
+
+_DOC_L3V1 = b'''<?xml version="1.0" encoding="UTF-8"?>
+<sbml xmlns="http://www.sbml.org/sbml/level3/version1/core"
+      xmlns:html="http://www.w3.org/1999/xhtml"
+      level="3" version="1">
+ <model id="test_model" name="Test model">
+  <listOfCompartments>
+   <compartment id="C_c" name="cell" constant="true"/>
+   <compartment id="C_b" name="boundary" constant="true"/>
+  </listOfCompartments>
+  <listOfSpecies>
+   <species id="M_Glucose_LPAREN_c_RPAREN_" name="Glucose" compartment="C_c"
+            constant="false" boundaryCondition="false"
+            hasOnlySubstanceUnits="false"/>
+   <species id="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_" name="Glucose-6-P"
+            compartment="C_c" constant="false" boundaryCondition="false"
+            hasOnlySubstanceUnits="false"/>
+   <species id="M_H2O_LPAREN_c_RPAREN_" name="H2O" compartment="C_c"
+            constant="false" boundaryCondition="false"
+            hasOnlySubstanceUnits="false"/>
+   <species id="M_Phosphate_LPAREN_c_RPAREN_" name="Phosphate"
+            compartment="C_c" constant="false" boundaryCondition="false"
+            hasOnlySubstanceUnits="false"/>
+   <species id="M_Biomass" name="Biomass" compartment="C_b" constant="false"
+            boundaryCondition="true" hasOnlySubstanceUnits="false"/>
+  </listOfSpecies>
+  <listOfReactions>
+   <reaction id="R_G6Pase" reversible="true" fast="false">
+    <listOfReactants>
+     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_" stoichiometry="2"
+                       constant="true"/>
+     <speciesReference species="M_Phosphate_LPAREN_c_RPAREN_" stoichiometry="2"
+                       constant="true"/>
+    </listOfReactants>
+    <listOfProducts>
+     <speciesReference species="M_H2O_LPAREN_c_RPAREN_" stoichiometry="2"
+                       constant="true"/>
+     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
+                       stoichiometry="2" constant="true"/>
+    </listOfProducts>
+    <notes>
+     <html:p>Glucose 6-phosphatase</html:p>
+    </notes>
+   </reaction>
+   <reaction id="R_Biomass" reversible="false" fast="false">
+    <listOfReactants>
+     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
+                       stoichiometry="0.56" constant="true"/>
+     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_"
+                       stoichiometry="0.88" constant="true"/>
+    </listOfReactants>
+    <listOfProducts>
+     <speciesReference species="M_Biomass" stoichiometry="1" constant="true"/>
+    </listOfProducts>
+   </reaction>
+  </listOfReactions>
+ </model>
+</sbml>'''
+
+_DOC_L3V1_FBC_V1 = b'''<?xml version="1.0" encoding="UTF-8"?>
+<sbml xmlns="http://www.sbml.org/sbml/level3/version1/core"
+      xmlns:fbc="http://www.sbml.org/sbml/level3/version1/fbc/version1"
+      xmlns:html="http://www.w3.org/1999/xhtml"
+      level="3" version="1"
+      fbc:required="false">
+ <model id="test_model" name="Test model">
+  <listOfCompartments>
+   <compartment id="C_c" name="cell" constant="true"/>
+   <compartment id="C_b" name="boundary" constant="true"/>
+  </listOfCompartments>
+  <listOfSpecies>
+   <species id="M_Glucose_LPAREN_c_RPAREN_" name="Glucose" compartment="C_c"
+            constant="false" boundaryCondition="false"
+            hasOnlySubstanceUnits="false" fbc:charge="0"
+            fbc:chemicalFormula="C6H12O6"/>
+   <species id="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_" name="Glucose-6-P"
+            compartment="C_c" constant="false" boundaryCondition="false"
+            hasOnlySubstanceUnits="false" fbc:charge="-2"
+            fbc:chemicalFormula="C6H11O9P"/>
+   <species id="M_H2O_LPAREN_c_RPAREN_" name="H2O" compartment="C_c"
+            constant="false" boundaryCondition="false"
+            hasOnlySubstanceUnits="false" fbc:charge="0"
+            fbc:chemicalFormula="H2O"/>
+   <species id="M_Phosphate_LPAREN_c_RPAREN_" name="Phosphate"
+            compartment="C_c" constant="false" boundaryCondition="false"
+            hasOnlySubstanceUnits="false" fbc:charge="-2"
+            fbc:chemicalFormula="HO4P"/>
+   <species id="M_Biomass" name="Biomass" compartment="C_b" constant="false"
+            boundaryCondition="true" hasOnlySubstanceUnits="false"/>
+  </listOfSpecies>
+  <listOfReactions>
+   <reaction id="R_G6Pase" reversible="true" fast="false">
+    <listOfReactants>
+     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_" stoichiometry="2"
+                       constant="true"/>
+     <speciesReference species="M_Phosphate_LPAREN_c_RPAREN_" stoichiometry="2"
+                       constant="true"/>
+    </listOfReactants>
+    <listOfProducts>
+     <speciesReference species="M_H2O_LPAREN_c_RPAREN_" stoichiometry="2"
+                       constant="true"/>
+     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
+                       stoichiometry="2" constant="true"/>
+    </listOfProducts>
+   </reaction>
+   <reaction id="R_Biomass" reversible="false" fast="false">
+    <listOfReactants>
+     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
+                       stoichiometry="0.56" constant="true"/>
+     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_"
+                       stoichiometry="0.88" constant="true"/>
+    </listOfReactants>
+    <listOfProducts>
+     <speciesReference species="M_Biomass" stoichiometry="1" constant="true"/>
+    </listOfProducts>
+   </reaction>
+  </listOfReactions>
+  <fbc:listOfObjectives fbc:activeObjective="obj1">
+   <fbc:objective fbc:id="obj1" fbc:name="Objective 1" fbc:type="maximize">
+    <fbc:listOfFluxObjectives>
+     <fbc:fluxObjective fbc:reaction="R_Biomass" fbc:coefficient="1"/>
+    </fbc:listOfFluxObjectives>
+   </fbc:objective>
+  </fbc:listOfObjectives>
+  <fbc:listOfFluxBounds>
+   <fbc:fluxBound fbc:reaction="R_G6Pase" fbc:operation="greaterEqual"
+                  fbc:value="-10"/>
+   <fbc:fluxBound fbc:reaction="R_G6Pase" fbc:operation="lessEqual"
+                  fbc:value="1000"/>
+   <fbc:fluxBound fbc:reaction="R_Biomass" fbc:operation="greaterEqual"
+                  fbc:value="0"/>
+   <fbc:fluxBound fbc:reaction="R_Biomass" fbc:operation="lessEqual"
+                  fbc:value="1000"/>
+  </fbc:listOfFluxBounds>
+ </model>
+</sbml>'''
+
+_DOC_L3V1_FBC_V2 = b'''<?xml version="1.0" encoding="UTF-8"?>
+<sbml xmlns="http://www.sbml.org/sbml/level3/version1/core"
+      xmlns:fbc="http://www.sbml.org/sbml/level3/version1/fbc/version2"
+      xmlns:html="http://www.w3.org/1999/xhtml"
+      level="3" version="1"
+      fbc:required="false">
+ <model id="test_model" name="Test model">
+  <notes>
+   <body xmlns="http://www.w3.org/1999/xhtml">
+    <p>This is model information intended to be seen by humans.</p>
+   </body>
+  </notes>
+  <listOfCompartments>
+   <compartment id="C_c" name="cell" constant="true"/>
+   <compartment id="C_b" name="boundary" constant="true"/>
+  </listOfCompartments>
+  <listOfSpecies>
+   <species id="M_Glucose_LPAREN_c_RPAREN_"
+            metaid="meta_M_Glucose_LPAREN_c_RPAREN_" name="Glucose"
+            compartment="C_c" constant="false" boundaryCondition="false"
+            hasOnlySubstanceUnits="false" fbc:charge="0"
+            fbc:chemicalFormula="C6H12O6">
+    <notes>
+     <body xmlns="http://www.w3.org/1999/xhtml">
+      <p>This is compound information intended to be seen by humans.</p>
+     </body>
+    </notes>
+   </species>
+   <species id="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_" name="Glucose-6-P"
+            compartment="C_c" constant="false" boundaryCondition="false"
+            hasOnlySubstanceUnits="false" fbc:charge="-2"
+            fbc:chemicalFormula="C6H11O9P"/>
+   <species id="M_H2O_LPAREN_c_RPAREN_" name="H2O" compartment="C_c"
+            constant="false" boundaryCondition="false"
+            hasOnlySubstanceUnits="false" fbc:charge="0"
+            fbc:chemicalFormula="H2O"/>
+   <species id="M_Phosphate_LPAREN_c_RPAREN_" name="Phosphate"
+            compartment="C_c" constant="false" boundaryCondition="false"
+            hasOnlySubstanceUnits="false" fbc:charge="-2"
+            fbc:chemicalFormula="HO4P"/>
+   <species id="M_Biomass" name="Biomass" compartment="C_b" constant="false"
+            boundaryCondition="true" hasOnlySubstanceUnits="false"/>
+  </listOfSpecies>
+  <listOfParameters>
+   <parameter constant="true" id="P_lower_G6Pase" value="-10"/>
+   <parameter constant="true" id="P_lower_zero" value="0"/>
+   <parameter constant="true" id="P_upper_default" value="1000"/>
+  </listOfParameters>
+  <listOfReactions>
+   <reaction id="R_G6Pase" metaid="meta_R_G6Pase" reversible="true"
+             fast="false" fbc:lowerFluxBound="P_lower_G6Pase"
+             fbc:upperFluxBound="P_upper_default">
+    <listOfReactants>
+     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_" stoichiometry="2"
+                       constant="true"/>
+     <speciesReference species="M_Phosphate_LPAREN_c_RPAREN_" stoichiometry="2"
+                       constant="true"/>
+    </listOfReactants>
+    <listOfProducts>
+     <speciesReference species="M_H2O_LPAREN_c_RPAREN_" stoichiometry="2"
+                       constant="true"/>
+     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
+                       stoichiometry="2" constant="true"/>
+    </listOfProducts>
+    <notes>
+     <body xmlns="http://www.w3.org/1999/xhtml">
+      <p>This is reaction information intended to be seen by humans.</p>
+     </body>
+    </notes>
+    <annotation>
+     <RDF xmlns="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+          xmlns:bqbiol="http://biomodels.net/biology-qualifiers/">
+      <Description about="#meta_R_G6Pase">
+       <bqbiol:isVersionOf>
+        <Bag>
+         <li resource="http://identifiers.org/ec-code/3.1.3.9"/>
+        </Bag>
+       </bqbiol:isVersionOf>
+      </Description>
+     </RDF>
+    </annotation>
+   </reaction>
+   <reaction id="R_Biomass" reversible="false" fast="false"
+             fbc:lowerFluxBound="P_lower_zero"
+             fbc:upperFluxBound="P_upper_default">
+    <listOfReactants>
+     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
+                       stoichiometry="0.56" constant="true"/>
+     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_"
+                       stoichiometry="0.88" constant="true"/>
+    </listOfReactants>
+    <listOfProducts>
+     <speciesReference species="M_Biomass" stoichiometry="1" constant="true"/>
+    </listOfProducts>
+   </reaction>
+  </listOfReactions>
+  <fbc:listOfObjectives fbc:activeObjective="obj1">
+   <fbc:objective fbc:id="obj1" fbc:name="Objective 1" fbc:type="maximize">
+    <fbc:listOfFluxObjectives>
+     <fbc:fluxObjective fbc:reaction="R_Biomass" fbc:coefficient="1"/>
+    </fbc:listOfFluxObjectives>
+   </fbc:objective>
+  </fbc:listOfObjectives>
+ </model>
+</sbml>'''
+
+
+class _SharedReaderMixin(object):
+    """Mixin that shares parsed readers between the tests of a class.
+
+    The document in ``_doc`` is parsed at most once per value of the
+    ``ignore_boundary`` option and the resulting readers are cached on the
+    class. This is safe because the tests only read from the readers.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls._readers = {}
+
+    @classmethod
+    def _make_reader(cls, ignore_boundary=True):
+        reader = cls._readers.get(ignore_boundary)
+        if reader is None:
+            reader = cls._readers[ignore_boundary] = sbml.SBMLReader(
+                cls._doc, ignore_boundary=ignore_boundary)
+        return reader
+
+
+class TestSBMLDatabaseL1V2(_SharedReaderMixin, unittest.TestCase):
+    """Test parsing of a simple level 1 version 2 SBML file"""
+
+    _doc = _DOC_L1V2
 
     def test_model_name(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         self.assertEqual(reader.name, 'Test model')
 
     def test_compartment_exists(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         compartments = {entry.id: entry for entry in reader.compartments}
         self.assertEqual(len(compartments), 2)
         self.assertEqual(compartments['cell'].id, 'cell')
@@ -97,14 +441,14 @@ class TestSBMLDatabaseL1V2(unittest.TestCase):
         self.assertEqual(compartments['boundary'].name, 'boundary')
 
     def test_compartment_exists_with_ignore_boundary(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=True)
+        reader = self._make_reader(ignore_boundary=True)
         compartments = {entry.id: entry for entry in reader.compartments}
         self.assertEqual(len(compartments), 1)
         self.assertEqual(compartments['cell'].id, 'cell')
         self.assertEqual(compartments['cell'].name, 'cell')
 
     def test_compounds_exist(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         species = {entry.id: entry for entry in reader.species}
         self.assertEqual(len(species), 5)
 
@@ -130,7 +474,7 @@ class TestSBMLDatabaseL1V2(unittest.TestCase):
         self.assertTrue(species['Biomass'].boundary)
 
     def test_g6pase_reaction_exists(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         reaction = reader.get_reaction('G6Pase')
         self.assertTrue(reaction.reversible)
 
@@ -143,7 +487,7 @@ class TestSBMLDatabaseL1V2(unittest.TestCase):
         self.assertEqual(reaction.equation, actual_equation)
 
     def test_biomass_reaction_exists(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         reaction = reader.get_reaction('Biomass')
         self.assertFalse(reaction.reversible)
 
@@ -157,7 +501,7 @@ class TestSBMLDatabaseL1V2(unittest.TestCase):
         self.assertEqual(reaction.equation, actual_equation)
 
     def test_reaction_xml_notes(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         reaction = reader.get_reaction('G6Pase')
         notes = reaction.xml_notes
 
@@ -167,121 +511,46 @@ class TestSBMLDatabaseL1V2(unittest.TestCase):
         self.assertEqual(notes_tags[0].text, 'Glucose 6-phosphatase')
 
     def test_objective_not_present(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         objectives = list(reader.objectives)
         self.assertEqual(len(objectives), 0)
         self.assertIsNone(reader.get_active_objective())
 
     def test_flux_bounds_not_present(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         flux_bounds = list(reader.flux_bounds)
         self.assertEqual(len(flux_bounds), 0)
 
     def test_create_and_convert_model(self):
-        reader = sbml.SBMLReader(self.doc)
-        model = reader.create_model()
-        sbml.convert_sbml_model(model)
-
-        self.assertEqual(
-            {entry.id for entry in model.compounds},
-            {'Glucose', 'Glucose_6_P', 'H2O', 'Phosphate'})
-        self.assertEqual(
-            {entry.id for entry in model.reactions},
-            {'G6Pase', 'Biomass'})
-        self.assertEqual(
-            {entry.id for entry in model.compartments},
-            {'cell'})
-
-        self.assertEqual(set(model.model), {'Biomass', 'G6Pase'})
-
-
-class TestSBMLDatabaseL2V5(unittest.TestCase):
-    """Test parsing of a simple level 2 version 5 SBML file"""
-
-    def setUp(self):
-        self.doc = BytesIO('''<?xml version="1.0" encoding="UTF-8"?>
-<sbml xmlns="http://www.sbml.org/sbml/level2/version5"
-      level="2" version="5">
- <model id="test_model" name="Test model">
-  <listOfCompartments>
-   <compartment id="C_c" name="cell"/>
-   <compartment id="C_b" name="boundary"/>
-  </listOfCompartments>
-  <listOfSpecies>
-   <species id="M_Glucose_LPAREN_c_RPAREN_" name="Glucose" compartment="C_c"
-            charge="0">
-    <notes>
-     <body xmlns="http://www.w3.org/1999/xhtml">
-      <p>FORMULA: C6H12O6</p>
-      <p>Charge: "0"</p>
-      <p>Additional notes..</p>
-      <p>KEGG ID: C00031</p>
-      <p>Custom: 123</p>
-     </body>
-    </notes>
-   </species>
-   <species id="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_" name="Glucose-6-P"
-            compartment="C_c" charge="-2"/>
-   <species id="M_H2O_LPAREN_c_RPAREN_" name="H2O" compartment="C_c"
-            charge="0"/>
-   <species id="M_Phosphate_LPAREN_c_RPAREN_" name="Phosphate"
-            compartment="C_c" boundaryCondition="false"/>
-   <species id="M_Biomass" name="Biomass" compartment="C_b"
-            boundaryCondition="true"/>
-  </listOfSpecies>
-  <listOfReactions>
-   <reaction id="R_G6Pase" reversible="true">
-    <listOfReactants>
-     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_" stoichiometry="2"/>
-     <speciesReference species="M_Phosphate_LPAREN_c_RPAREN_"
-                       stoichiometry="2"/>
-    </listOfReactants>
-    <listOfProducts>
-     <speciesReference species="M_H2O_LPAREN_c_RPAREN_" stoichiometry="2"/>
-     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
-                       stoichiometry="2"/>
-    </listOfProducts>
-    <notes>
-     <body xmlns="http://www.w3.org/1999/xhtml">
-      <p> Authors: Jane Doe ; John Doe </p>
-      <p>CONFIDENCE: 3</p>
-      <p>EC NUMBER: 3.1.3.9</p>
-      <p>gene association :   b0822 </p>
-      <p>SUBSYSTEM: "Glycolysis / Gluconeogenesis"</p>
-      <p>Additional notes...</p>
-     </body>
-    </notes>
-   </reaction>
-   <reaction id="R_Biomass" reversible="false">
-    <listOfReactants>
-     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
-                       stoichiometry="0.56"/>
-     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_"
-                       stoichiometry="0.88"/>
-    </listOfReactants>
-    <listOfProducts>
-     <speciesReference species="M_Biomass"/>
-    </listOfProducts>
-    <kineticLaw>
-     <listOfParameters>
-      <parameter id="LOWER_BOUND" value="0"/>
-      <parameter id="UPPER_BOUND" value="1000"/>
-      <parameter id="SOME_CUSTOM_PARAMETER" value="123.4"/>
-      <parameter id="OBJECTIVE_COEFFICIENT" value="1"/>
-     </listOfParameters>
-    </kineticLaw>
-   </reaction>
-  </listOfReactions>
- </model>
-</sbml>'''.encode('utf-8'))
+        reader = self._make_reader()
+        model = reader.create_model()
+        sbml.convert_sbml_model(model)
+
+        self.assertEqual(
+            {entry.id for entry in model.compounds},
+            {'Glucose', 'Glucose_6_P', 'H2O', 'Phosphate'})
+        self.assertEqual(
+            {entry.id for entry in model.reactions},
+            {'G6Pase', 'Biomass'})
+        self.assertEqual(
+            {entry.id for entry in model.compartments},
+            {'cell'})
+
+        self.assertEqual(set(model.model), {'Biomass', 'G6Pase'})
+
+
+class TestSBMLDatabaseL2V5(_SharedReaderMixin, unittest.TestCase):
+    """Test parsing of a simple level 2 version 5 SBML file"""
+
+    _doc = _DOC_L2V5
 
     def test_model_name(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         self.assertEqual(reader.id, 'test_model')
         self.assertEqual(reader.name, 'Test model')
 
     def test_compartment_exists(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         compartments = {entry.id: entry for entry in reader.compartments}
         self.assertEqual(len(compartments), 2)
         self.assertEqual(compartments['C_c'].id, 'C_c')
@@ -290,14 +559,14 @@ class TestSBMLDatabaseL2V5(unittest.TestCase):
         self.assertEqual(compartments['C_b'].name, 'boundary')
 
     def test_compartment_exists_with_ignore_boundary(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=True)
+        reader = self._make_reader(ignore_boundary=True)
         compartments = {entry.id: entry for entry in reader.compartments}
         self.assertEqual(len(compartments), 1)
         self.assertEqual(compartments['C_c'].id, 'C_c')
         self.assertEqual(compartments['C_c'].name, 'cell')
 
     def test_compounds_exist(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         species = {entry.id: entry for entry in reader.species}
         self.assertEqual(len(species), 5)
 
@@ -326,7 +595,7 @@ class TestSBMLDatabaseL2V5(unittest.TestCase):
         self.assertTrue(species['M_Biomass'].boundary)
 
     def test_glucose_parse_notes(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         species = reader.get_species('M_Glucose_LPAREN_c_RPAREN_')
         notes_dict = sbml.parse_xhtml_species_notes(species)
         self.assertEqual(notes_dict, {
@@ -336,7 +605,7 @@ class TestSBMLDatabaseL2V5(unittest.TestCase):
         })
 
     def test_g6pase_reaction_exists(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         reaction = reader.get_reaction('R_G6Pase')
         self.assertTrue(reaction.reversible)
 
@@ -351,7 +620,7 @@ class TestSBMLDatabaseL2V5(unittest.TestCase):
         self.assertEqual(reaction.equation, actual_equation)
 
     def test_g6pase_parse_notes(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         reaction = reader.get_reaction('R_G6Pase')
         notes = sbml.parse_xhtml_reaction_notes(reaction)
         self.assertEqual(notes, {
@@ -363,7 +632,7 @@ class TestSBMLDatabaseL2V5(unittest.TestCase):
         })
 
     def test_parse_reaction_cobra_flux_bounds(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         reaction = reader.get_reaction('R_G6Pase')
         lower, upper = sbml.parse_flux_bounds(reaction)
         self.assertIsNone(lower)
@@ -375,7 +644,7 @@ class TestSBMLDatabaseL2V5(unittest.TestCase):
         self.assertEqual(upper, 1000)
 
     def test_parse_reaction_cobra_objective(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         reaction = reader.get_reaction('R_G6Pase')
         coeff = sbml.parse_objective_coefficient(reaction)
         self.assertIsNone(coeff)
@@ -385,7 +654,7 @@ class TestSBMLDatabaseL2V5(unittest.TestCase):
         self.assertEqual(coeff, 1)
 
     def test_biomass_reaction_exists(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         reaction = reader.get_reaction('R_Biomass')
         self.assertFalse(reaction.reversible)
 
@@ -400,18 +669,18 @@ class TestSBMLDatabaseL2V5(unittest.TestCase):
         self.assertEqual(reaction.equation, actual_equation)
 
     def test_objective_not_present(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         objectives = list(reader.objectives)
         self.assertEqual(len(objectives), 0)
         self.assertIsNone(reader.get_active_objective())
 
     def test_flux_bounds_not_present(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         flux_bounds = list(reader.flux_bounds)
         self.assertEqual(len(flux_bounds), 0)
 
     def test_create_and_convert_model(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         model = reader.create_model()
         sbml.convert_sbml_model(model)
 
@@ -430,75 +699,18 @@ class TestSBMLDatabaseL2V5(unittest.TestCase):
         self.assertEqual(set(model.model), {'Biomass', 'G6Pase'})
 
 
-class TestSBMLDatabaseL3V1(unittest.TestCase):
+class TestSBMLDatabaseL3V1(_SharedReaderMixin, unittest.TestCase):
     """Test parsing of a simple level 3 version 1 SBML file"""
 
-    def setUp(self):
-        self.doc = BytesIO('''<?xml version="1.0" encoding="UTF-8"?>
-<sbml xmlns="http://www.sbml.org/sbml/level3/version1/core"
-      xmlns:html="http://www.w3.org/1999/xhtml"
-      level="3" version="1">
- <model id="test_model" name="Test model">
-  <listOfCompartments>
-   <compartment id="C_c" name="cell" constant="true"/>
-   <compartment id="C_b" name="boundary" constant="true"/>
-  </listOfCompartments>
-  <listOfSpecies>
-   <species id="M_Glucose_LPAREN_c_RPAREN_" name="Glucose" compartment="C_c"
-            constant="false" boundaryCondition="false"
-            hasOnlySubstanceUnits="false"/>
-   <species id="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_" name="Glucose-6-P"
-            compartment="C_c" constant="false" boundaryCondition="false"
-            hasOnlySubstanceUnits="false"/>
-   <species id="M_H2O_LPAREN_c_RPAREN_" name="H2O" compartment="C_c"
-            constant="false" boundaryCondition="false"
-            hasOnlySubstanceUnits="false"/>
-   <species id="M_Phosphate_LPAREN_c_RPAREN_" name="Phosphate"
-            compartment="C_c" constant="false" boundaryCondition="false"
-            hasOnlySubstanceUnits="false"/>
-   <species id="M_Biomass" name="Biomass" compartment="C_b" constant="false"
-            boundaryCondition="true" hasOnlySubstanceUnits="false"/>
-  </listOfSpecies>
-  <listOfReactions>
-   <reaction id="R_G6Pase" reversible="true" fast="false">
-    <listOfReactants>
-     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_" stoichiometry="2"
-                       constant="true"/>
-     <speciesReference species="M_Phosphate_LPAREN_c_RPAREN_" stoichiometry="2"
-                       constant="true"/>
-    </listOfReactants>
-    <listOfProducts>
-     <speciesReference species="M_H2O_LPAREN_c_RPAREN_" stoichiometry="2"
-                       constant="true"/>
-     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
-                       stoichiometry="2" constant="true"/>
-    </listOfProducts>
-    <notes>
-     <html:p>Glucose 6-phosphatase</html:p>
-    </notes>
-   </reaction>
-   <reaction id="R_Biomass" reversible="false" fast="false">
-    <listOfReactants>
-     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
-                       stoichiometry="0.56" constant="true"/>
-     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_"
-                       stoichiometry="0.88" constant="true"/>
-    </listOfReactants>
-    <listOfProducts>
-     <speciesReference species="M_Biomass" stoichiometry="1" constant="true"/>
-    </listOfProducts>
-   </reaction>
-  </listOfReactions>
- </model>
-</sbml>'''.encode('utf-8'))
+    _doc = _DOC_L3V1
 
     def test_model_name(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         self.assertEqual(reader.id, 'test_model')
         self.assertEqual(reader.name, 'Test model')
 
     def test_compartment_exists(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         compartments = {entry.id: entry for entry in reader.compartments}
         self.assertEqual(len(compartments), 2)
         self.assertEqual(compartments['C_c'].id, 'C_c')
@@ -507,14 +719,14 @@ class TestSBMLDatabaseL3V1(unittest.TestCase):
         self.assertEqual(compartments['C_b'].name, 'boundary')
 
     def test_compartment_exists_with_ignore_boundary(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=True)
+        reader = self._make_reader(ignore_boundary=True)
         compartments = {entry.id: entry for entry in reader.compartments}
         self.assertEqual(len(compartments), 1)
         self.assertEqual(compartments['C_c'].id, 'C_c')
         self.assertEqual(compartments['C_c'].name, 'cell')
 
     def test_compounds_exist(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         species = {entry.id: entry for entry in reader.species}
         self.assertEqual(len(species), 5)
 
@@ -540,7 +752,7 @@ class TestSBMLDatabaseL3V1(unittest.TestCase):
         self.assertTrue(species['M_Biomass'].boundary)
 
     def test_g6pase_reaction_exists(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         reaction = reader.get_reaction('R_G6Pase')
         self.assertTrue(reaction.reversible)
 
@@ -555,7 +767,7 @@ class TestSBMLDatabaseL3V1(unittest.TestCase):
         self.assertEqual(reaction.equation, actual_equation)
 
     def test_biomass_reaction_exists(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         reaction = reader.get_reaction('R_Biomass')
         self.assertFalse(reaction.reversible)
 
@@ -570,7 +782,7 @@ class TestSBMLDatabaseL3V1(unittest.TestCase):
         self.assertEqual(reaction.equation, actual_equation)
 
     def test_reaction_xml_notes(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         reaction = reader.get_reaction('R_G6Pase')
         notes = reaction.xml_notes
 
@@ -580,18 +792,18 @@ class TestSBMLDatabaseL3V1(unittest.TestCase):
         self.assertEqual(notes_tags[0].text, 'Glucose 6-phosphatase')
 
     def test_objective_not_present(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         objectives = list(reader.objectives)
         self.assertEqual(len(objectives), 0)
         self.assertIsNone(reader.get_active_objective())
 
     def test_flux_bounds_not_present(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         flux_bounds = list(reader.flux_bounds)
         self.assertEqual(len(flux_bounds), 0)
 
     def test_create_and_convert_model(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         model = reader.create_model()
         sbml.convert_sbml_model(model)
 
@@ -608,95 +820,18 @@ class TestSBMLDatabaseL3V1(unittest.TestCase):
         self.assertEqual(set(model.model), {'Biomass', 'G6Pase'})
 
 
-class TestSBMLDatabaseL3V1WithFBCV1(unittest.TestCase):
+class TestSBMLDatabaseL3V1WithFBCV1(_SharedReaderMixin, unittest.TestCase):
     """Test parsing of a level 3 version 1 SBML file with FBC version 1"""
 
-    def setUp(self):
-        self.doc = BytesIO('''<?xml version="1.0" encoding="UTF-8"?>
-<sbml xmlns="http://www.sbml.org/sbml/level3/version1/core"
-      xmlns:fbc="http://www.sbml.org/sbml/level3/version1/fbc/version1"
-      xmlns:html="http://www.w3.org/1999/xhtml"
-      level="3" version="1"
-      fbc:required="false">
- <model id="test_model" name="Test model">
-  <listOfCompartments>
-   <compartment id="C_c" name="cell" constant="true"/>
-   <compartment id="C_b" name="boundary" constant="true"/>
-  </listOfCompartments>
-  <listOfSpecies>
-   <species id="M_Glucose_LPAREN_c_RPAREN_" name="Glucose" compartment="C_c"
-            constant="false" boundaryCondition="false"
-            hasOnlySubstanceUnits="false" fbc:charge="0"
-            fbc:chemicalFormula="C6H12O6"/>
-   <species id="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_" name="Glucose-6-P"
-            compartment="C_c" constant="false" boundaryCondition="false"
-            hasOnlySubstanceUnits="false" fbc:charge="-2"
-            fbc:chemicalFormula="C6H11O9P"/>
-   <species id="M_H2O_LPAREN_c_RPAREN_" name="H2O" compartment="C_c"
-            constant="false" boundaryCondition="false"
-            hasOnlySubstanceUnits="false" fbc:charge="0"
-            fbc:chemicalFormula="H2O"/>
-   <species id="M_Phosphate_LPAREN_c_RPAREN_" name="Phosphate"
-            compartment="C_c" constant="false" boundaryCondition="false"
-            hasOnlySubstanceUnits="false" fbc:charge="-2"
-            fbc:chemicalFormula="HO4P"/>
-   <species id="M_Biomass" name="Biomass" compartment="C_b" constant="false"
-            boundaryCondition="true" hasOnlySubstanceUnits="false"/>
-  </listOfSpecies>
-  <listOfReactions>
-   <reaction id="R_G6Pase" reversible="true" fast="false">
-    <listOfReactants>
-     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_" stoichiometry="2"
-                       constant="true"/>
-     <speciesReference species="M_Phosphate_LPAREN_c_RPAREN_" stoichiometry="2"
-                       constant="true"/>
-    </listOfReactants>
-    <listOfProducts>
-     <speciesReference species="M_H2O_LPAREN_c_RPAREN_" stoichiometry="2"
-                       constant="true"/>
-     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
-                       stoichiometry="2" constant="true"/>
-    </listOfProducts>
-   </reaction>
-   <reaction id="R_Biomass" reversible="false" fast="false">
-    <listOfReactants>
-     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
-                       stoichiometry="0.56" constant="true"/>
-     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_"
-                       stoichiometry="0.88" constant="true"/>
-    </listOfReactants>
-    <listOfProducts>
-     <speciesReference species="M_Biomass" stoichiometry="1" constant="true"/>
-    </listOfProducts>
-   </reaction>
-  </listOfReactions>
-  <fbc:listOfObjectives fbc:activeObjective="obj1">
-   <fbc:objective fbc:id="obj1" fbc:name="Objective 1" fbc:type="maximize">
-    <fbc:listOfFluxObjectives>
-     <fbc:fluxObjective fbc:reaction="R_Biomass" fbc:coefficient="1"/>
-    </fbc:listOfFluxObjectives>
-   </fbc:objective>
-  </fbc:listOfObjectives>
-  <fbc:listOfFluxBounds>
-   <fbc:fluxBound fbc:reaction="R_G6Pase" fbc:operation="greaterEqual"
-                  fbc:value="-10"/>
-   <fbc:fluxBound fbc:reaction="R_G6Pase" fbc:operation="lessEqual"
-                  fbc:value="1000"/>
-   <fbc:fluxBound fbc:reaction="R_Biomass" fbc:operation="greaterEqual"
-                  fbc:value="0"/>
-   <fbc:fluxBound fbc:reaction="R_Biomass" fbc:operation="lessEqual"
-                  fbc:value="1000"/>
-  </fbc:listOfFluxBounds>
- </model>
-</sbml>'''.encode('utf-8'))
+    _doc = _DOC_L3V1_FBC_V1
 
     def test_model_name(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         self.assertEqual(reader.id, 'test_model')
         self.assertEqual(reader.name, 'Test model')
 
     def test_compartment_exists(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         compartments = {entry.id: entry for entry in reader.compartments}
         self.assertEqual(len(compartments), 2)
         self.assertEqual(compartments['C_c'].id, 'C_c')
@@ -705,7 +840,7 @@ class TestSBMLDatabaseL3V1WithFBCV1(unittest.TestCase):
         self.assertEqual(compartments['C_b'].name, 'boundary')
 
     def test_compounds_exist(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         species = {entry.id: entry for entry in reader.species}
         self.assertEqual(len(species), 5)
 
@@ -740,7 +875,7 @@ class TestSBMLDatabaseL3V1WithFBCV1(unittest.TestCase):
         self.assertIsNone(species['M_Biomass'].charge)
 
     def test_g6pase_reaction_exists(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         reaction = reader.get_reaction('R_G6Pase')
         self.assertTrue(reaction.reversible)
 
@@ -758,7 +893,7 @@ class TestSBMLDatabaseL3V1WithFBCV1(unittest.TestCase):
         self.assertEqual(reaction.properties['upper_flux'], 1000)
 
     def test_biomass_reaction_exists(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         reaction = reader.get_reaction('R_Biomass')
         self.assertFalse(reaction.reversible)
 
@@ -776,7 +911,7 @@ class TestSBMLDatabaseL3V1WithFBCV1(unittest.TestCase):
         self.assertEqual(reaction.properties['upper_flux'], 1000)
 
     def test_objective_exists(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         objectives = {entry.id: entry for entry in reader.objectives}
         self.assertEqual(len(objectives), 1)
 
@@ -786,12 +921,12 @@ class TestSBMLDatabaseL3V1WithFBCV1(unittest.TestCase):
         self.assertEqual(dict(objective.reactions), {'R_Biomass': 1})
 
     def test_active_objective(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         objectives = {entry.id: entry for entry in reader.objectives}
         self.assertEqual(reader.get_active_objective(), objectives['obj1'])
 
     def test_flux_bounds_exists(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         flux_bounds = list(reader.flux_bounds)
         self.assertEqual(len(flux_bounds), 4)
 
@@ -810,7 +945,7 @@ class TestSBMLDatabaseL3V1WithFBCV1(unittest.TestCase):
             ('lessEqual', 1000)})
 
     def test_create_and_convert_model(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         model = reader.create_model()
         sbml.convert_sbml_model(model)
 
@@ -830,123 +965,18 @@ class TestSBMLDatabaseL3V1WithFBCV1(unittest.TestCase):
         self.assertEqual(model.biomass_reaction, 'Biomass')
 
 
-class TestSBMLDatabaseL3V1WithFBCV2(unittest.TestCase):
+class TestSBMLDatabaseL3V1WithFBCV2(_SharedReaderMixin, unittest.TestCase):
     """Test parsing of a level 3 version 1 SBML file with FBC version 2"""
 
-    def setUp(self):
-        self.doc = BytesIO('''<?xml version="1.0" encoding="UTF-8"?>
-<sbml xmlns="http://www.sbml.org/sbml/level3/version1/core"
-      xmlns:fbc="http://www.sbml.org/sbml/level3/version1/fbc/version2"
-      xmlns:html="http://www.w3.org/1999/xhtml"
-      level="3" version="1"
-      fbc:required="false">
- <model id="test_model" name="Test model">
-  <notes>
-   <body xmlns="http://www.w3.org/1999/xhtml">
-    <p>This is model information intended to be seen by humans.</p>
-   </body>
-  </notes>
-  <listOfCompartments>
-   <compartment id="C_c" name="cell" constant="true"/>
-   <compartment id="C_b" name="boundary" constant="true"/>
-  </listOfCompartments>
-  <listOfSpecies>
-   <species id="M_Glucose_LPAREN_c_RPAREN_"
-            metaid="meta_M_Glucose_LPAREN_c_RPAREN_" name="Glucose"
-            compartment="C_c" constant="false" boundaryCondition="false"
-            hasOnlySubstanceUnits="false" fbc:charge="0"
-            fbc:chemicalFormula="C6H12O6">
-    <notes>
-     <body xmlns="http://www.w3.org/1999/xhtml">
-      <p>This is compound information intended to be seen by humans.</p>
-     </body>
-    </notes>
-   </species>
-   <species id="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_" name="Glucose-6-P"
-            compartment="C_c" constant="false" boundaryCondition="false"
-            hasOnlySubstanceUnits="false" fbc:charge="-2"
-            fbc:chemicalFormula="C6H11O9P"/>
-   <species id="M_H2O_LPAREN_c_RPAREN_" name="H2O" compartment="C_c"
-            constant="false" boundaryCondition="false"
-            hasOnlySubstanceUnits="false" fbc:charge="0"
-            fbc:chemicalFormula="H2O"/>
-   <species id="M_Phosphate_LPAREN_c_RPAREN_" name="Phosphate"
-            compartment="C_c" constant="false" boundaryCondition="false"
-            hasOnlySubstanceUnits="false" fbc:charge="-2"
-            fbc:chemicalFormula="HO4P"/>
-   <species id="M_Biomass" name="Biomass" compartment="C_b" constant="false"
-            boundaryCondition="true" hasOnlySubstanceUnits="false"/>
-  </listOfSpecies>
-  <listOfParameters>
-   <parameter constant="true" id="P_lower_G6Pase" value="-10"/>
-   <parameter constant="true" id="P_lower_zero" value="0"/>
-   <parameter constant="true" id="P_upper_default" value="1000"/>
-  </listOfParameters>
-  <listOfReactions>
-   <reaction id="R_G6Pase" metaid="meta_R_G6Pase" reversible="true"
-             fast="false" fbc:lowerFluxBound="P_lower_G6Pase"
-             fbc:upperFluxBound="P_upper_default">
-    <listOfReactants>
-     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_" stoichiometry="2"
-                       constant="true"/>
-     <speciesReference species="M_Phosphate_LPAREN_c_RPAREN_" stoichiometry="2"
-                       constant="true"/>
-    </listOfReactants>
-    <listOfProducts>
-     <speciesReference species="M_H2O_LPAREN_c_RPAREN_" stoichiometry="2"
-                       constant="true"/>
-     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
-                       stoichiometry="2" constant="true"/>
-    </listOfProducts>
-    <notes>
-     <body xmlns="http://www.w3.org/1999/xhtml">
-      <p>This is reaction information intended to be seen by humans.</p>
-     </body>
-    </notes>
-    <annotation>
-     <RDF xmlns="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
-          xmlns:bqbiol="http://biomodels.net/biology-qualifiers/">
-      <Description about="#meta_R_G6Pase">
-       <bqbiol:isVersionOf>
-        <Bag>
-         <li resource="http://identifiers.org/ec-code/3.1.3.9"/>
-        </Bag>
-       </bqbiol:isVersionOf>
-      </Description>
-     </RDF>
-    </annotation>
-   </reaction>
-   <reaction id="R_Biomass" reversible="false" fast="false"
-             fbc:lowerFluxBound="P_lower_zero"
-             fbc:upperFluxBound="P_upper_default">
-    <listOfReactants>
-     <speciesReference species="M_Glucose_6_DASH_P_LPAREN_c_RPAREN_"
-                       stoichiometry="0.56" constant="true"/>
-     <speciesReference species="M_Glucose_LPAREN_c_RPAREN_"
-                       stoichiometry="0.88" constant="true"/>
-    </listOfReactants>
-    <listOfProducts>
-     <speciesReference species="M_Biomass" stoichiometry="1" constant="true"/>
-    </listOfProducts>
-   </reaction>
-  </listOfReactions>
-  <fbc:listOfObjectives fbc:activeObjective="obj1">
-   <fbc:objective fbc:id="obj1" fbc:name="Objective 1" fbc:type="maximize">
-    <fbc:listOfFluxObjectives>
-     <fbc:fluxObjective fbc:reaction="R_Biomass" fbc:coefficient="1"/>
-    </fbc:listOfFluxObjectives>
-   </fbc:objective>
-  </fbc:listOfObjectives>
- </model>
-</sbml>'''.encode('utf-8'))
+    _doc = _DOC_L3V1_FBC_V2
 
     def test_model_name(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         self.assertEqual(reader.id, 'test_model')
         self.assertEqual(reader.name, 'Test model')
 
     def test_compartment_exists(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         compartments = {entry.id: entry for entry in reader.compartments}
         self.assertEqual(len(compartments), 2)
         self.assertEqual(compartments['C_c'].id, 'C_c')
@@ -955,7 +985,7 @@ class TestSBMLDatabaseL3V1WithFBCV2(unittest.TestCase):
         self.assertEqual(compartments['C_b'].name, 'boundary')
 
     def test_compounds_exist(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         species = {entry.id: entry for entry in reader.species}
         self.assertEqual(len(species), 5)
 
@@ -992,7 +1022,7 @@ class TestSBMLDatabaseL3V1WithFBCV2(unittest.TestCase):
         self.assertIsNone(species['M_Biomass'].charge)
 
     def test_g6pase_reaction_exists(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         reaction = reader.get_reaction('R_G6Pase')
         self.assertTrue(reaction.reversible)
 
@@ -1013,7 +1043,7 @@ class TestSBMLDatabaseL3V1WithFBCV2(unittest.TestCase):
         self.assertIsNotNone(reaction.xml_annotation)
 
     def test_biomass_reaction_exists(self):
-        reader = sbml.SBMLReader(self.doc, ignore_boundary=False)
+        reader = self._make_reader(ignore_boundary=False)
         reaction = reader.get_reaction('R_Biomass')
         self.assertFalse(reaction.reversible)
 
@@ -1034,7 +1064,7 @@ class TestSBMLDatabaseL3V1WithFBCV2(unittest.TestCase):
         self.assertIsNone(reaction.xml_annotation)
 
     def test_objective_exists(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         objectives = {entry.id: entry for entry in reader.objectives}
         self.assertEqual(len(objectives), 1)
 
@@ -1044,18 +1074,18 @@ class TestSBMLDatabaseL3V1WithFBCV2(unittest.TestCase):
         self.assertEqual(dict(objective.reactions), {'R_Biomass': 1})
 
     def test_active_objective(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         objectives = {entry.id: entry for entry in reader.objectives}
         self.assertEqual(reader.get_active_objective(),
                          objectives['obj1'])
 
     def test_flux_bounds_not_present(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         flux_bounds = list(reader.flux_bounds)
         self.assertEqual(len(flux_bounds), 0)
 
     def test_create_and_convert_model(self):
-        reader = sbml.SBMLReader(self.doc)
+        reader = self._make_reader()
         model = reader.create_model()
         sbml.convert_sbml_model(model)
 
@@ -1075,6 +1105,57 @@ class TestSBMLDatabaseL3V1WithFBCV2(unittest.TestCase):
         self.assertEqual(model.biomass_reaction, 'Biomass')
 
 
+def _synthesize_large_doc(n_reactions):
+    """Return a synthetic level 3 document with the given reaction count."""
+    species = ['<species id="M_{0}" compartment="C_c" constant="false"'
+               ' boundaryCondition="false"'
+               ' hasOnlySubstanceUnits="false"/>'.format(i)
+               for i in range(n_reactions + 1)]
+    reactions = ['<reaction id="R_{0}" reversible="true" fast="false">'
+                 '<listOfReactants>'
+                 '<speciesReference species="M_{0}" stoichiometry="1"'
+                 ' constant="true"/>'
+                 '</listOfReactants>'
+                 '<listOfProducts>'
+                 '<speciesReference species="M_{1}" stoichiometry="2"'
+                 ' constant="true"/>'
+                 '</listOfProducts>'
+                 '</reaction>'.format(i, i + 1)
+                 for i in range(n_reactions)]
+    doc = ('<?xml version="1.0" encoding="UTF-8"?>'
+           '<sbml xmlns="http://www.sbml.org/sbml/level3/version1/core"'
+           ' level="3" version="1">'
+           '<model id="large_model" name="Large model">'
+           '<listOfCompartments>'
+           '<compartment id="C_c" name="cell" constant="true"/>'
+           '</listOfCompartments>'
+           '<listOfSpecies>{}</listOfSpecies>'
+           '<listOfReactions>{}</listOfReactions>'
+           '</model>'
+           '</sbml>').format(''.join(species), ''.join(reactions))
+    return doc.encode('utf-8')
+
+
+class TestSBMLParseLargeModel(unittest.TestCase):
+    """Benchmark parsing of a synthetic large model.
+
+    The test only runs when the PSAMM_BENCH environment variable is set.
+    It provides a reproducible target for profiling changes to the reader
+    parse path.
+    """
+
+    @unittest.skipUnless(
+        os.environ.get('PSAMM_BENCH'),
+        'benchmark only runs when PSAMM_BENCH is set')
+    def test_parse_large_model(self):
+        doc = _synthesize_large_doc(1000)
+        start = time.time()
+        reader = sbml.SBMLReader(doc)
+        elapsed = time.time() - start
+        self.assertEqual(sum(1 for _ in reader.reactions), 1000)
+        self.assertLess(elapsed, 10)
+
+
 class TestModelExtracellularCompartment(unittest.TestCase):
     def setUp(self):
         self.model = native.NativeModel()
@@ -1322,12 +1322,12 @@ class TestCompExit(unittest.TestCase):
         self.native = native_model
         self.mm = native_model.create_metabolic_model()
 
-    def test_sys_exit(self):
-        with self.assertRaises(SystemExit):
+    def test_missing_formulas(self):
+        with self.assertRaises(ValueError):
             graph.make_network_dict(self.native, self.mm)
 
     def test_with_element(self):
-        with self.assertRaises(SystemExit):
+        with self.assertRaises(ValueError):
             graph.make_network_dict(self.native, self.mm,
                                     method='no-fpp', element='C')
 